@@ -10,42 +10,96 @@ This enables gradual migration: plugins can be written for lerna and still
 work with hydra-core installations.
 """
 
+import functools
 import sys
 from importlib import import_module
+from typing import Tuple
 
 from hydra.core.config_search_path import ConfigSearchPath
 from hydra.core.config_store import ConfigStore
 from hydra.plugins.search_path_plugin import SearchPathPlugin
 
 if sys.version_info < (3, 10):
-    from importlib_metadata import entry_points
+    from importlib_metadata import EntryPoint, entry_points
 else:
-    from importlib.metadata import entry_points
+    from importlib.metadata import EntryPoint, entry_points
+
+
+@functools.cache
+def _get_lerna_entry_points() -> Tuple[EntryPoint, ...]:
+    """
+    Scan installed distributions for lerna plugin entry points, once per process.
+
+    `importlib.metadata.entry_points()` re-reads every installed distribution's
+    metadata on each call, which can take seconds in fat environments. Cache
+    the result so repeated discovery (including from other lerna import sites)
+    does not rescan the disk.
+    """
+    # NOTE: use `lernaplugins` instead of `plugins`
+    # for https://github.com/facebookresearch/hydra/pull/3052
+    discovered = list(entry_points(group="hydra.lernaplugins"))
+    discovered.extend(entry_points(group="lerna.plugins"))
+    return tuple(discovered)
+
 
-# NOTE: use `lernaplugins` instead of `plugins`
-# for https://github.com/facebookresearch/hydra/pull/3052
-_discovered_plugins = list(entry_points(group="hydra.lernaplugins"))
-_discovered_plugins.extend(list(entry_points(group="lerna.plugins")))
 _searchpaths_pkg = {}
 _discovered_plugin_names = []
-for entry_point in _discovered_plugins:
-    if entry_point.value.startswith(("pkg:", "file:")):
-        # This is a package style entry point
-        kind, pkg_name = entry_point.value.split(":", 1)
-        _searchpaths_pkg[entry_point.name] = f"{kind}://{pkg_name}"
-        continue
-    # Otherwise, it's a module style entry point
-    try:
-        mod = import_module(entry_point.value)
-    except ImportError:
-        # Silently skip entry points that fail to import. These are optional
-        # third-party plugins and their absence should not disrupt the system.
-        continue
-    for attr in dir(mod):
-        thing = getattr(mod, attr)
-        if isinstance(thing, type) and issubclass(thing, SearchPathPlugin):
-            _discovered_plugin_names.append(thing.__name__)
-            globals()[thing.__name__] = thing
+_initialized = False
+
+
+def _init() -> None:
+    """
+    Import discovered plugin modules and register their SearchPathPlugin classes.
+
+    This must run at import time: hydra-core discovers plugins by scanning
+    this module's members right after importing it, so classes injected any
+    later are never seen and their manipulate_search_path never runs. The
+    guard keeps repeated calls (e.g. from manipulate_search_path) free.
+    """
+    global _initialized
+    if _initialized:
+        return
+    _initialized = True
+    # Deterministic ordering, and skip classes already registered when two
+    # entry points expose the same module
+    seen: set = set()
+    for entry_point in sorted(_get_lerna_entry_points(), key=lambda e: (e.name, e.value)):
+        # single scan instead of startswith + split
+        kind, sep, pkg_name = entry_point.value.partition(":")
+        if sep and kind in ("pkg", "file"):
+            # This is a package style entry point, no import needed
+            _searchpaths_pkg[entry_point.name] = f"{kind}://{pkg_name}"
+            continue
+        # Otherwise, it's a module style entry point
+        try:
+            mod = import_module(entry_point.value)
+        except ImportError:
+            # Silently skip entry points that fail to import. These are optional
+            # third-party plugins and their absence should not disrupt the system.
+            continue
+        # Scan only names the module explicitly exports (or its own attributes),
+        # rather than dir(mod): dir() includes inherited names and triggers any
+        # module __getattr__/lazy-import hooks for attributes we do not need.
+        exported = getattr(mod, "__all__", None)
+        if exported is not None:
+            candidates = [getattr(mod, name, None) for name in exported]
+        else:
+            candidates = list(vars(mod).values())
+        for thing in candidates:
+            if (
+                isinstance(thing, type)
+                and issubclass(thing, SearchPathPlugin)
+                and thing.__module__ == mod.__name__
+            ):
+                key = (thing.__module__, thing.__name__)
+                if key in seen:
+                    continue
+                seen.add(key)
+                _discovered_plugin_names.append(thing.__name__)
+                globals()[thing.__name__] = thing
+
+
+_init()
 
 
 class LernaGenericSearchPathPlugin(SearchPathPlugin):
@@ -58,6 +112,7 @@ class LernaGenericSearchPathPlugin(SearchPathPlugin):
     """
 
     def manipulate_search_path(self, search_path: ConfigSearchPath) -> None:
+        _init()
         if _searchpaths_pkg:
             for provider, path in _searchpaths_pkg.items():
                 inst = ConfigStore.instance()
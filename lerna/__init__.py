@@ -9,7 +9,7 @@ from lerna.errors import MissingConfigException
 from lerna.main import main
 from lerna.types import TaskFunction
 
-from .compose import compose
+from .compose import compose, compose_cached
 from .initialize import initialize, initialize_config_dir, initialize_config_module
 
 CallbackManager = _rust.CallbackManager
@@ -35,6 +35,7 @@ __all__ = [
     "utils",
     "TaskFunction",
     "compose",
+    "compose_cached",
     "initialize",
     "initialize_config_module",
     "initialize_config_dir",
@@ -25,7 +25,13 @@ class BasicLauncherConf:
     _target_: str = "lerna._internal.core_plugins.basic_launcher.BasicLauncher"
 
 
-ConfigStore.instance().store(group="hydra/launcher", name="basic", node=BasicLauncherConf, provider="hydra")
+def _register_config() -> None:
+    # Called again by Plugins._initialize: the ConfigStore is rebuilt on
+    # every Singleton state reset, after this module has been imported.
+    ConfigStore.instance().store(group="hydra/launcher", name="basic", node=BasicLauncherConf, provider="hydra")
+
+
+_register_config()
 
 
 class BasicLauncher(Launcher):
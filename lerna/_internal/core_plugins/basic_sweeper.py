@@ -44,7 +44,13 @@ class BasicSweeperConf:
     params: Optional[Dict[str, str]] = None
 
 
-ConfigStore.instance().store(group="hydra/sweeper", name="basic", node=BasicSweeperConf, provider="hydra")
+def _register_config() -> None:
+    # Called again by Plugins._initialize: the ConfigStore is rebuilt on
+    # every Singleton state reset, after this module has been imported.
+    ConfigStore.instance().store(group="hydra/sweeper", name="basic", node=BasicSweeperConf, provider="hydra")
+
+
+_register_config()
 
 
 log = logging.getLogger(__name__)
@@ -1,6 +1,7 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 import os
-from typing import List, Optional
+import sys
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import yaml
 from omegaconf import OmegaConf
@@ -16,82 +17,172 @@ try:
 except ImportError:
     _RUST_AVAILABLE = False
 
+# Prefer the libyaml-backed loader when present; the pure-Python SafeLoader
+# is an order of magnitude slower and only needed when libyaml is missing.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Parse cache shared by all FileConfigSource instances, keyed by the resolved
+# file path and holding (st_mtime_ns, st_size, header, raw parsed value).
+# Composition loads the same files many times per run; memoizing on mtime/size
+# collapses that to one read+parse per unique file while still picking up
+# on-disk edits. Only the raw parsed value is cached (not the OmegaConf node):
+# callers mutate the returned config, e.g. to pop the defaults list.
+_CACHE: Dict[str, Tuple[int, int, Dict[str, Optional[str]], Any]] = {}
+
 
 class FileConfigSource(ConfigSource):
     def __init__(self, provider: str, path: str) -> None:
-        if path.find("://") == -1:
-            path = f"{self.scheme()}://{path}"
+        # Detect our scheme with one startswith instead of scanning for "://";
+        # scheme-less paths get the prefix added, foreign schemes are left for
+        # the base class to reject.
+        prefix = self.scheme() + "://"
+        if not path.startswith(prefix) and "://" not in path:
+            path = prefix + path
         super().__init__(provider=provider, path=path)
+        # Resolve symlinks in the base once; realpath issues an lstat per path
+        # component, which is wasteful to repeat for every config lookup.
+        self._base = os.path.realpath(self.path)
+        # Interned so the thousands of ConfigResults built during composition
+        # share one provider/path string instead of allocating per result.
+        self._path_uri = sys.intern(f"{self.scheme()}://{self.path}")
+        self._provider = sys.intern(provider)
 
     @staticmethod
     def scheme() -> str:
         return "file"
 
+    def _full_path(self, config_path: str) -> str:
+        if ".." in config_path.split("/"):
+            # the relative path can escape the resolved base; fall back to
+            # a full resolution
+            return os.path.realpath(os.path.join(self._base, config_path))
+        return os.path.join(self._base, config_path)
+
     def load_config(self, config_path: str) -> ConfigResult:
         normalized_config_path = self._normalize_file_name(config_path)
-        full_path = os.path.realpath(os.path.join(self.path, normalized_config_path))
+        full_path = self._full_path(normalized_config_path)
         if not os.path.exists(full_path):
             raise ConfigLoadError(f"Config not found : {full_path}")
 
-        with open(full_path, encoding="utf-8") as f:
-            content = f.read()
-
-            # Extract header using Rust if available
-            if _RUST_AVAILABLE:
-                header = _rs.extract_header_dict(content)
+        st = os.stat(full_path)
+        cached = _CACHE.get(full_path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            header, raw = cached[2], cached[3]
+        else:
+            with open(full_path, encoding="utf-8") as f:
+                content = f.read()
+
+                if not content or content.isspace():
+                    # stub configs are common; skip parser spin-up entirely
+                    header = {"package": None}
+                    raw = {}
+                else:
+                    # Extract header using Rust if available
+                    if _RUST_AVAILABLE:
+                        header = _rs.extract_header_dict(content)
+                    else:
+                        header = ConfigSource._get_header_dict(content)
+
+                    if _RUST_AVAILABLE:
+                        # Use Rust for fast YAML parsing; the checked variant
+                        # reports failure without raising across the FFI
+                        # boundary, keeping the fallback branch-cheap
+                        ok, raw = _rs.try_parse_yaml(content)
+                        if not ok:
+                            # Fall back to Python YAML parser on errors
+                            f.seek(0)
+                            raw = yaml.load(f, Loader=_YamlLoader)
+                    else:
+                        f.seek(0)
+                        raw = yaml.load(f, Loader=_YamlLoader)
+            if raw is None:
+                raw = {}
+            _CACHE[full_path] = (st.st_mtime_ns, st.st_size, header, raw)
+
+        return self._make_result(header, raw)
+
+    def _make_result(self, header: Dict[str, Optional[str]], raw: Any) -> ConfigResult:
+        return ConfigResult(
+            config=OmegaConf.create(raw),
+            path=self._path_uri,
+            provider=self._provider,
+            header=header,
+        )
+
+    def load_configs(self, config_paths: List[str]) -> List[ConfigResult]:
+        """
+        Load several configs at once, parsing all cache misses in a single
+        Rust call. Per-call FFI overhead dominates when many small YAML files
+        are parsed one at a time; batching turns N header+parse crossings
+        into one.
+        """
+        if not _RUST_AVAILABLE:
+            return [self.load_config(p) for p in config_paths]
+
+        results: List[Optional[ConfigResult]] = [None] * len(config_paths)
+        pending: List[Tuple[int, str, os.stat_result, str]] = []
+        for idx, config_path in enumerate(config_paths):
+            normalized_config_path = self._normalize_file_name(config_path)
+            full_path = self._full_path(normalized_config_path)
+            if not os.path.exists(full_path):
+                raise ConfigLoadError(f"Config not found : {full_path}")
+            st = os.stat(full_path)
+            cached = _CACHE.get(full_path)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                results[idx] = self._make_result(cached[2], cached[3])
+                continue
+            with open(full_path, encoding="utf-8") as f:
+                pending.append((idx, full_path, st, f.read()))
+
+        if pending:
+            try:
+                parsed = _rs.parse_yaml_batch([content for _, _, _, content in pending])
+            except Exception:
+                # a file the Rust parser rejects fails the whole batch;
+                # retry one at a time through the single-file fallback path
+                parsed = None
+            if parsed is None:
+                for idx, _, _, _ in pending:
+                    results[idx] = self.load_config(config_paths[idx])
             else:
-                header = ConfigSource._get_header_dict(content)
-
-            if _RUST_AVAILABLE:
-                # Use Rust for fast YAML parsing
-                try:
-                    raw_config = _rs.parse_yaml(content)
-                    if raw_config is None:
-                        raw_config = {}
-                    cfg = OmegaConf.create(raw_config)
-                except Exception:
-                    # Fall back to Python YAML parser on errors
-                    f.seek(0)
-                    raw = yaml.safe_load(f)
+                for (idx, full_path, st, _), (header, raw) in zip(pending, parsed):
                     if raw is None:
                         raw = {}
-                    cfg = OmegaConf.create(raw)
-            else:
-                f.seek(0)
-                raw = yaml.safe_load(f)
-                if raw is None:
-                    raw = {}
-                cfg = OmegaConf.create(raw)
+                    _CACHE[full_path] = (st.st_mtime_ns, st.st_size, header, raw)
+                    results[idx] = self._make_result(header, raw)
 
-            return ConfigResult(
-                config=cfg,
-                path=f"{self.scheme()}://{self.path}",
-                provider=self.provider,
-                header=header,
-            )
+        return results  # type: ignore[return-value]
 
     def available(self) -> bool:
         return self.is_group("")
 
     def is_group(self, config_path: str) -> bool:
-        full_path = os.path.realpath(os.path.join(self.path, config_path))
+        full_path = self._full_path(config_path)
         return os.path.isdir(full_path)
 
     def is_config(self, config_path: str) -> bool:
         config_path = self._normalize_file_name(config_path)
-        full_path = os.path.realpath(os.path.join(self.path, config_path))
+        full_path = self._full_path(config_path)
         return os.path.isfile(full_path)
 
     def list(self, config_path: str, results_filter: Optional[ObjectType]) -> List[str]:
-        files: List[str] = []
-        full_path = os.path.realpath(os.path.join(self.path, config_path))
-        for file in os.listdir(full_path):
-            file_path = os.path.join(config_path, file)
-            self._list_add_result(
-                files=files,
-                file_path=file_path,
-                file_name=file,
-                results_filter=results_filter,
-            )
-
-        return sorted(list(set(files)))
+        files: Set[str] = set()
+        full_path = self._full_path(config_path)
+        # scandir's DirEntry caches the file type from the directory read,
+        # avoiding one stat per entry
+        with os.scandir(full_path) as entries:
+            for entry in entries:
+                file_path = os.path.join(config_path, entry.name)
+                self._list_add_result(
+                    files=files,
+                    file_path=file_path,
+                    file_name=entry.name,
+                    results_filter=results_filter,
+                    is_file=entry.is_file(),
+                    is_dir=entry.is_dir(),
+                )
+
+        return sorted(files)
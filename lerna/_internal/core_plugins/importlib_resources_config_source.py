@@ -1,8 +1,9 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import operator
 import os
-import zipfile
+import sys
 from importlib import resources
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 import yaml
 from omegaconf import OmegaConf
@@ -18,12 +19,35 @@ try:
 except ImportError:
     _RUST_AVAILABLE = False
 
+# Prefer the libyaml-backed loader when present; the pure-Python SafeLoader
+# is an order of magnitude slower and only needed when libyaml is missing.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Whether a traversable type provides is_file/is_dir, cached per class.
+# importlib-resources hands back a handful of types (MultiplexedPath,
+# zipfile.Path, OrphanPath, ...) but a traversal touches thousands of
+# entries; one lookup by class identity beats an MRO scan per entry.
+_IS_FILE_CACHE: Dict[type, bool] = {}
+_IS_DIR_CACHE: Dict[type, bool] = {}
+
+# Prebound methodcallers dispatch the actual call in C, skipping a
+# Python-level attribute load per entry on hot traversals.
+_IS_FILE_MC = operator.methodcaller("is_file")
+_IS_DIR_MC = operator.methodcaller("is_dir")
+
 
 class ImportlibResourcesConfigSource(ConfigSource):
     def __init__(self, provider: str, path: str) -> None:
         super().__init__(provider=provider, path=path)
         # normalize to pkg format
         self.path = self.path.replace("/", ".").rstrip(".")
+        # Interned so the thousands of ConfigResults built during composition
+        # share one provider/path string instead of allocating per result.
+        self._path_uri = sys.intern(f"{self.scheme()}://{self.path}")
+        self._provider = sys.intern(provider)
 
     @staticmethod
     def scheme() -> str:
@@ -36,11 +60,13 @@ class ImportlibResourcesConfigSource(ConfigSource):
         Works around importlib-resources 6.2+ OrphanPath issue (Hydra #2870).
         OrphanPath objects may not have is_file/is_dir/exists methods.
         """
-        try:
-            return res.is_file()
-        except AttributeError:
-            # OrphanPath or similar object without is_file method
-            return False
+        t = type(res)
+        has = _IS_FILE_CACHE.get(t)
+        if has is None:
+            has = callable(getattr(t, "is_file", None))
+            _IS_FILE_CACHE[t] = has
+        # OrphanPath or similar object without is_file method
+        return bool(_IS_FILE_MC(res)) if has else False
 
     @staticmethod
     def _safe_is_dir(res: Any) -> bool:
@@ -48,54 +74,44 @@ class ImportlibResourcesConfigSource(ConfigSource):
 
         Works around importlib-resources 6.2+ OrphanPath issue (Hydra #2870).
         """
-        try:
-            return res.is_dir()
-        except AttributeError:
-            return False
+        t = type(res)
+        has = _IS_DIR_CACHE.get(t)
+        if has is None:
+            has = callable(getattr(t, "is_dir", None))
+            _IS_DIR_CACHE[t] = has
+        return bool(_IS_DIR_MC(res)) if has else False
 
     def _read_config(self, res: Any) -> ConfigResult:
         try:
-            if isinstance(res, zipfile.Path):
-                # zipfile does not support encoding, read() calls returns bytes.
-                f = res.open()
-            else:
-                f = res.open(encoding="utf-8")
+            # Read bytes regardless of backing store (zip or filesystem) and
+            # hand them to Rust directly; decoding to str in Python just to
+            # have Rust re-encode is a wasted round-trip on large configs.
+            f = res.open("rb")
             content = f.read()
-            if isinstance(content, bytes):
-                # if content is bytes, utf-8 decode (zipfile path)
-                content_str = content.decode("utf-8")
-            else:
-                content_str = content
 
-            # Use Rust for header extraction if available
-            if _RUST_AVAILABLE:
-                header = _rs.extract_header_dict(content_str)
-            else:
-                header = ConfigSource._get_header_dict(content_str)
-
-            # Use Rust for fast YAML parsing if available
-            if _RUST_AVAILABLE:
-                try:
-                    raw_config = _rs.parse_yaml(content_str)
-                    if raw_config is None:
-                        raw_config = {}
-                    cfg = OmegaConf.create(raw_config)
-                except Exception:
+            if not content or content.isspace():
+                # stub configs are common; skip parser spin-up entirely
+                header = {"package": None}
+                raw = {}
+            elif _RUST_AVAILABLE:
+                header = _rs.extract_header_bytes(content)
+                # checked variant reports failure without raising across the
+                # FFI boundary, keeping the fallback branch-cheap
+                ok, raw = _rs.try_parse_yaml_bytes(content)
+                if not ok:
                     # Fall back to Python YAML parser on errors
-                    raw = yaml.safe_load(content_str)
-                    if raw is None:
-                        raw = {}
-                    cfg = OmegaConf.create(raw)
+                    raw = yaml.load(content, Loader=_YamlLoader)
             else:
-                raw = yaml.safe_load(content_str)
-                if raw is None:
-                    raw = {}
-                cfg = OmegaConf.create(raw)
+                header = ConfigSource._get_header_dict(content.decode("utf-8"))
+                raw = yaml.load(content, Loader=_YamlLoader)
+            if raw is None:
+                raw = {}
+            cfg = OmegaConf.create(raw)
 
             return ConfigResult(
                 config=cfg,
-                path=f"{self.scheme()}://{self.path}",
-                provider=self.provider,
+                path=self._path_uri,
+                provider=self._provider,
                 header=header,
             )
         finally:
@@ -135,7 +151,7 @@ class ImportlibResourcesConfigSource(ConfigSource):
         return self._safe_is_file(res)
 
     def list(self, config_path: str, results_filter: Optional[ObjectType]) -> List[str]:
-        files: List[str] = []
+        files: Set[str] = set()
         for file in resources.files(self.path).joinpath(config_path).iterdir():
             fname = file.name
             fpath = os.path.join(config_path, fname)
@@ -146,4 +162,4 @@ class ImportlibResourcesConfigSource(ConfigSource):
                 results_filter=results_filter,
             )
 
-        return sorted(list(set(files)))
+        return sorted(files)
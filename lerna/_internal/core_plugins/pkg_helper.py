@@ -5,11 +5,28 @@ Helper functions for pkg:// protocol support using importlib.resources.
 These functions are designed to be passed to RustHybridConfigRepository as callbacks.
 """
 
+import functools
 from importlib import resources
 from typing import Any, Dict, List, Optional
 
 import yaml
 
+# Prefer the libyaml-backed loader when present; the pure-Python SafeLoader
+# is an order of magnitude slower and only needed when libyaml is missing.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+@functools.lru_cache(maxsize=256)
+def _files(module_path: str) -> Any:
+    """
+    Cached resources.files: each call otherwise performs a metadata finder
+    lookup and builds a fresh traversable for the same module.
+    """
+    return resources.files(module_path)
+
 
 def load_pkg_config(module_path: str, config_path: str) -> Optional[Dict[str, Any]]:
     """
@@ -23,11 +40,11 @@ def load_pkg_config(module_path: str, config_path: str) -> Optional[Dict[str, An
         Parsed YAML as dict, or None if the file doesn't exist
     """
     try:
-        files = resources.files(module_path)
+        files = _files(module_path)
 
         # Normalize path - add .yaml extension if needed
         path = config_path
-        if not path.endswith(".yaml") and not path.endswith(".yml"):
+        if not path.endswith((".yaml", ".yml")):
             path = f"{path}.yaml"
 
         file_resource = files.joinpath(path)
@@ -38,7 +55,7 @@ def load_pkg_config(module_path: str, config_path: str) -> Optional[Dict[str, An
         content = file_resource.read_text(encoding="utf-8")
         if not content.strip():
             return {}
-        return yaml.safe_load(content)
+        return yaml.load(content, Loader=_YamlLoader)
     except (ModuleNotFoundError, FileNotFoundError, TypeError):
         return None
 
@@ -55,11 +72,11 @@ def pkg_config_exists(module_path: str, config_path: str) -> bool:
         True if the file exists, False otherwise
     """
     try:
-        files = resources.files(module_path)
+        files = _files(module_path)
 
         # Normalize path - add .yaml extension if needed
         path = config_path
-        if not path.endswith(".yaml") and not path.endswith(".yml"):
+        if not path.endswith((".yaml", ".yml")):
             path = f"{path}.yaml"
 
         resource = files.joinpath(path)
@@ -80,7 +97,7 @@ def pkg_group_exists(module_path: str, group_path: str) -> bool:
         True if the directory exists, False otherwise
     """
     try:
-        files = resources.files(module_path)
+        files = _files(module_path)
         if not group_path:
             # Root of the package
             return True
@@ -102,7 +119,7 @@ def pkg_list_options(module_path: str, group_path: str) -> List[str]:
         List of option names (without .yaml extension)
     """
     try:
-        files = resources.files(module_path)
+        files = _files(module_path)
         if group_path:
             files = files.joinpath(group_path)
 
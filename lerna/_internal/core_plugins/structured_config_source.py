@@ -1,7 +1,7 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 import importlib
 import warnings
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from lerna.core.config_store import ConfigStore
 from lerna.core.object_type import ObjectType
@@ -48,7 +48,7 @@ class StructuredConfigSource(ConfigSource):
         return type_ == ObjectType.CONFIG
 
     def list(self, config_path: str, results_filter: Optional[ObjectType]) -> List[str]:
-        ret: List[str] = []
+        ret: Set[str] = set()
         files = ConfigStore.instance().list(config_path)
 
         for file in files:
@@ -58,4 +58,4 @@ class StructuredConfigSource(ConfigSource):
                 file_name=file,
                 results_filter=results_filter,
             )
-        return sorted(list(set(ret)))
+        return sorted(ret)
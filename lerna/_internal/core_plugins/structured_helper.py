@@ -6,13 +6,24 @@ These callbacks allow Rust's PyHybridConfigRepository to load configs
 from Python's ConfigStore singleton.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from omegaconf import OmegaConf
 
 from lerna.core.config_store import ConfigStore
 from lerna.core.object_type import ObjectType
 
+# Cache of to_container results keyed by config path, validated against the
+# identity of the stored node. to_container recursively copies the whole
+# DictConfig tree, which Rust-side lookups would otherwise repeat for every
+# access to the same structured path.
+_CONTAINER_CACHE: Dict[str, Tuple[Any, Any]] = {}
+
+
+def invalidate_structured_cache() -> None:
+    """Drop cached container conversions, e.g. after ConfigStore mutations."""
+    _CONTAINER_CACHE.clear()
+
 
 def load_structured_config(config_path: str) -> Optional[Dict[str, Any]]:
     """
@@ -30,9 +41,17 @@ def load_structured_config(config_path: str) -> Optional[Dict[str, Any]]:
         path = config_path
         if not path.endswith(".yaml"):
             path = f"{path}.yaml"
-        config_node = cs.load(path)
+        # Read the stored node without ConfigStore.load's defensive deepcopy:
+        # it is only converted here, never mutated. The node's identity keys
+        # the cache so re-storing under the same path invalidates naturally.
+        node = cs._load(path).node
+        cached = _CONTAINER_CACHE.get(path)
+        if cached is not None and cached[0] is node:
+            return cached[1]
         # Convert DictConfig to plain dict for Rust
-        return OmegaConf.to_container(config_node.node, resolve=False)
+        container = OmegaConf.to_container(node, resolve=False)
+        _CONTAINER_CACHE[path] = (node, container)
+        return container
     except Exception:
         return None
 
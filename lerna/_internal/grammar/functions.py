@@ -1,7 +1,7 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 import inspect
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, List, Tuple
 
 from omegaconf._utils import type_str
 
@@ -9,6 +9,16 @@ from lerna._internal.grammar.utils import is_type_matching
 from lerna.core.override_parser.types import QuotedString
 from lerna.errors import HydraException
 
+# Types whose .text attribute holds the unquoted value. Checked with a single
+# isinstance against this tuple instead of per-argument hasattr probing.
+_QUOTED_TYPES: Tuple[type, ...] = (QuotedString,)
+try:
+    from lerna.lerna import QuotedString as _RustQuotedString
+
+    _QUOTED_TYPES = (QuotedString, _RustQuotedString)
+except ImportError:
+    pass
+
 
 @dataclass
 class FunctionCall:
@@ -19,9 +29,10 @@ class FunctionCall:
 
 @dataclass
 class Functions:
-    # Names of functions that the Rust parser handles natively
-    RUST_NATIVE_FUNCTIONS: set = field(
-        default_factory=lambda: {
+    # Names of functions that the Rust parser handles natively.
+    # Shared class-level frozenset: immutable, no per-instance allocation.
+    RUST_NATIVE_FUNCTIONS: ClassVar[FrozenSet[str]] = frozenset(
+        {
             "choice",
             "range",
             "interval",
@@ -40,6 +51,9 @@ class Functions:
 
     definitions: Dict[str, inspect.Signature] = field(default_factory=dict)
     functions: Dict[str, Callable[..., Any]] = field(default_factory=dict)
+    # Per-function {param name: (kind, annotation)}, precomputed at register
+    # time so eval does not re-walk Signature.parameters per argument
+    param_meta: Dict[str, Dict[str, Tuple[Any, Any]]] = field(default_factory=dict)
     # Tracks which Rust-native functions have been overridden by user registrations
     user_overrides: set = field(default_factory=set)
 
@@ -47,8 +61,10 @@ class Functions:
         if name in self.definitions:
             raise HydraException(f"Function named '{name}' is already registered")
 
-        self.definitions[name] = inspect.signature(func)
+        sig = inspect.signature(func)
+        self.definitions[name] = sig
         self.functions[name] = func
+        self.param_meta[name] = {p.name: (p.kind, p.annotation) for p in sig.parameters.values()}
 
         # Track if this is a user override of a Rust-native function
         # _builtin=True is used by create_functions() to avoid marking defaults as overrides
@@ -60,34 +76,17 @@ class Functions:
             raise HydraException(f"Unknown function '{func.name}'\nAvailable: {','.join(sorted(self.definitions.keys()))}\n")
         sig = self.definitions[func.name]
 
-        # unquote strings in args
-        # Handle both Python QuotedString dataclass and Rust PyQuotedString class
-        args = []
-        for arg in func.args:
-            if isinstance(arg, QuotedString):
-                arg = arg.text
-            elif hasattr(arg, "text") and hasattr(arg, "quote"):
-                # Rust PyQuotedString has text and quote attributes
-                arg = arg.text
-            args.append(arg)
-
-        # Unquote strings in kwargs values
-        kwargs = {}
-        for key, val in func.kwargs.items():
-            if isinstance(val, QuotedString):
-                val = val.text
-            elif hasattr(val, "text") and hasattr(val, "quote"):
-                # Rust PyQuotedString has text and quote attributes
-                val = val.text
-            kwargs[key] = val
+        # unquote strings in args/kwargs; _QUOTED_TYPES covers both the Python
+        # QuotedString dataclass and the Rust QuotedString class
+        args = [arg.text if isinstance(arg, _QUOTED_TYPES) else arg for arg in func.args]
+        kwargs = {key: val.text if isinstance(val, _QUOTED_TYPES) else val for key, val in func.kwargs.items()}
 
         bound = sig.bind(*args, **kwargs)
 
-        for idx, arg in enumerate(bound.arguments.items()):
-            name = arg[0]
-            value = arg[1]
-            expected_type = sig.parameters[name].annotation
-            if sig.parameters[name].kind == inspect.Parameter.VAR_POSITIONAL:
+        param_meta = self.param_meta[func.name]
+        for name, value in bound.arguments.items():
+            kind, expected_type = param_meta[name]
+            if kind == inspect.Parameter.VAR_POSITIONAL:
                 for iidx, v in enumerate(value):
                     if not is_type_matching(v, expected_type):
                         raise TypeError(f"mismatch type argument {name}[{iidx}]: {type_str(type(v))} is incompatible with {type_str(expected_type)}")
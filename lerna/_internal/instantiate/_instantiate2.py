@@ -165,6 +165,17 @@ def _find_bad_interpolation_key(cfg: Any, prefix: str = "") -> str | None:
     return None
 
 
+def _has_interpolation(value: Any) -> bool:
+    """Check an unresolved container for any `${...}` interpolation."""
+    if isinstance(value, str):
+        return "${" in value
+    if isinstance(value, dict):
+        return any(_has_interpolation(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_interpolation(v) for v in value)
+    return False
+
+
 def _resolve_with_context(cfg: Any) -> None:
     """Resolve config with enhanced error context.
 
@@ -172,6 +183,11 @@ def _resolve_with_context(cfg: Any) -> None:
     This fixes Hydra #2235.
     """
     try:
+        # Most configs contain no interpolations at all; one unresolved
+        # walk is much cheaper than OmegaConf.resolve's resolving
+        # traversal, so skip the resolve entirely when nothing can change.
+        if not _has_interpolation(OmegaConf.to_container(cfg, resolve=False)):
+            return
         OmegaConf.resolve(cfg)
     except OmegaConfBaseException as e:
         # Try to find the key that caused the error
@@ -1,6 +1,8 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import copy
+import functools
 from textwrap import dedent
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from omegaconf import DictConfig, OmegaConf, open_dict
 
@@ -62,3 +64,66 @@ def compose(
             OmegaConf.set_struct(cfg, strict)
 
     return cfg
+
+
+@functools.lru_cache(maxsize=128)
+def _compose_cached(
+    search_path_key: Tuple[Tuple[str, str], ...],
+    config_name: Optional[str],
+    overrides: Tuple[str, ...],
+    return_hydra_config: bool,
+) -> DictConfig:
+    # search_path_key is only part of the cache key: it distinguishes
+    # otherwise-identical calls made under different initializations
+    del search_path_key
+    return compose(
+        config_name=config_name,
+        overrides=list(overrides),
+        return_hydra_config=return_hydra_config,
+    )
+
+
+def compose_cached(
+    config_name: Optional[str] = None,
+    overrides: Optional[List[str]] = None,
+    return_hydra_config: bool = False,
+) -> DictConfig:
+    """
+    Like :func:`compose`, but memoizes results by (search path,
+    config_name, overrides).
+
+    Composition is deterministic in its inputs, so repeated compositions
+    with the same arguments (common in tests and notebooks) are served
+    from an in-memory cache, skipping YAML parsing and defaults
+    resolution. Each call returns a deep copy, so mutating the result
+    does not leak into later calls.
+
+    The cache key does not include ConfigStore or plugin state: if config
+    files on disk change, or configs are registered or removed after a
+    result was cached, call ``compose_cached.cache_clear()`` to drop the
+    stale entries. Results composed under a different initialization are
+    kept apart by the search-path part of the key.
+
+    :param config_name: the name of the config
+           (usually the file name without the .yaml extension)
+    :param overrides: list of overrides for config file
+    :param return_hydra_config: True to return the hydra config node in the result
+    :return: the composed config
+    """
+    gh = GlobalHydra.instance()
+    assert gh.is_initialized(), "GlobalHydra is not initialized, use @hydra.main() or call one of the hydra initialization methods first"
+    assert gh.hydra is not None
+    search_path_key = tuple(
+        (entry.provider, entry.path) for entry in gh.hydra.config_loader.get_search_path().get_path()
+    )
+    cached = _compose_cached(
+        search_path_key,
+        config_name,
+        tuple(overrides) if overrides is not None else (),
+        return_hydra_config,
+    )
+    return copy.deepcopy(cached)
+
+
+# invalidation hook: drops every cached composition (see docstring above)
+compose_cached.cache_clear = _compose_cached.cache_clear  # type: ignore[attr-defined]
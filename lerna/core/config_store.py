@@ -1,6 +1,6 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
-import copy
-from dataclasses import dataclass
+import dataclasses
+import sys
 from typing import Any, Dict, List, Optional
 
 from omegaconf import DictConfig, OmegaConf
@@ -39,13 +39,50 @@ class ConfigStoreWithProvider:
     def __exit__(self, exc_type: Any, exc_value: Any, exc_traceback: Any) -> Any: ...
 
 
-@dataclass
 class ConfigNode:
-    name: str
-    node: DictConfig
-    group: Optional[str]
-    package: Optional[str]
-    provider: Optional[str]
+    """
+    A stored config entry.
+
+    ``node`` is materialized into a ``DictConfig`` lazily on first access:
+    ``store`` is called hundreds of times at import time registering schemas,
+    and most of them are only ever read back through the Rust store as plain
+    dicts, so paying ``OmegaConf.structured`` up front for every registration
+    is wasted cold-start work.
+    """
+
+    # a store holds thousands of nodes; slots drop the per-instance __dict__
+    __slots__ = ("name", "_raw_node", "_node", "group", "package", "provider")
+
+    def __init__(
+        self,
+        name: str,
+        node: Any,
+        group: Optional[str],
+        package: Optional[str],
+        provider: Optional[str],
+    ) -> None:
+        self.name = name
+        self._raw_node = node
+        self._node: Optional[DictConfig] = None
+        self.group = group
+        self.package = package
+        self.provider = provider
+
+    @property
+    def node(self) -> DictConfig:
+        if self._node is None:
+            raw = self._raw_node
+            if isinstance(raw, DictConfig):
+                # already a config; re-running OmegaConf.structured would
+                # just walk and rebuild an equivalent tree
+                self._node = raw
+            else:
+                self._node = OmegaConf.structured(raw)
+        return self._node
+
+    @node.setter
+    def node(self, value: DictConfig) -> None:
+        self._node = value
 
 
 class ConfigStore(metaclass=Singleton):
@@ -58,6 +95,10 @@ class ConfigStore(metaclass=Singleton):
 
     def __init__(self) -> None:
         self.repo = {}
+        # Flat path -> entry index over the nested repo, so lookups are a
+        # single dict hit instead of a per-fragment walk. Group entries map to
+        # the same dict objects that live in the nested tree.
+        self._index = {"": self.repo}
         # Initialize Rust store if available
         if _RUST_AVAILABLE:
             self._rust_store = _RustConfigStore()
@@ -77,6 +118,17 @@ class ConfigStore(metaclass=Singleton):
             self._rust_store = _RustConfigStore()
         else:
             self._rust_store = None
+        # Rebuild the flat index when restoring state that predates it
+        if "_index" not in self.__dict__:
+            self._index = {"": self.repo}
+            self._index_subtree("", self.repo)
+
+    def _index_subtree(self, prefix: str, d: Dict[str, Any]) -> None:
+        for key, entry in d.items():
+            path = f"{prefix}/{key}" if prefix else key
+            self._index[path] = entry
+            if isinstance(entry, dict):
+                self._index_subtree(path, entry)
 
     def store(
         self,
@@ -98,13 +150,19 @@ class ConfigStore(metaclass=Singleton):
         :param provider: the name of the module/app providing this config.
             Helps debugging.
         """
-        # Convert node to dict for Rust storage
-        cfg = OmegaConf.structured(node)
-
         # Store in Rust if available
         if self._rust_store is not None:
-            # Convert OmegaConf to plain dict for Rust
-            node_dict = OmegaConf.to_container(cfg, resolve=False)
+            # Plain dicts and dataclass instances can be handed to Rust as-is;
+            # the OmegaConf.structured + to_container round-trip deep-walks the
+            # node twice only to arrive back at an equivalent plain dict.
+            if isinstance(node, dict) or isinstance(node, DictConfig):
+                # the Rust store walks dicts and OmegaConf containers
+                # directly; no to_container teardown needed
+                node_dict: Any = node
+            elif dataclasses.is_dataclass(node) and not isinstance(node, type):
+                node_dict = dataclasses.asdict(node)
+            else:
+                node_dict = OmegaConf.structured(node)
             self._rust_store.store(
                 name=name,
                 node=node_dict,
@@ -115,26 +173,49 @@ class ConfigStore(metaclass=Singleton):
 
         # Also store in Python repo for backward compatibility
         cur = self.repo
+        prefix = ""
         if group is not None:
-            for d in group.split("/"):
+            # most groups are a single fragment; skip the split allocation.
+            # Fragments (hydra, launcher, ...) repeat across thousands of
+            # stores; interned keys compare by identity on lookup.
+            frags = (group,) if "/" not in group else group.split("/")
+            for d in map(sys.intern, frags):
                 if d not in cur:
                     cur[d] = {}
                 cur = cur[d]
+                prefix = f"{prefix}/{d}" if prefix else d
+                self._index[prefix] = cur
 
         if not name.endswith(".yaml"):
             name = f"{name}.yaml"
         assert isinstance(cur, dict)
-        cur[name] = ConfigNode(name=name, node=cfg, group=group, package=package, provider=provider)
+        # The raw node is stored as-is; ConfigNode.node builds the DictConfig
+        # on first access
+        entry = ConfigNode(name=name, node=node, group=group, package=package, provider=provider)
+        cur[name] = entry
+        self._index[f"{prefix}/{name}" if prefix else name] = entry
 
     def load(self, config_path: str) -> ConfigNode:
         ret = self._load(config_path)
 
-        # shallow copy to avoid changing the original stored ConfigNode
-        ret = copy.copy(ret)
-        assert isinstance(ret, ConfigNode)
-        # copy to avoid mutations to config effecting subsequent calls
-        ret.node = copy.deepcopy(ret.node)
-        return ret
+        # Build a fresh ConfigNode directly instead of copy.copy plus a field
+        # fixup. Callers mutate the returned config (e.g. popping the
+        # defaults list), and a fresh node converts the raw value again on
+        # first access, giving the same isolation as the deepcopy this used
+        # to do - or skipping the conversion entirely for callers that only
+        # read the metadata fields.
+        raw = ret._raw_node
+        if isinstance(raw, DictConfig):
+            # the lazy property hands DictConfigs back as-is, so the copy
+            # that isolates callers from the store has to happen here
+            raw = OmegaConf.create(raw)
+        return ConfigNode(
+            name=ret.name,
+            node=raw,
+            group=ret.group,
+            package=ret.package,
+            provider=ret.provider,
+        )
 
     def _load(self, config_path: str) -> ConfigNode:
         idx = config_path.rfind("/")
@@ -178,12 +259,14 @@ class ConfigStore(metaclass=Singleton):
         return sorted(d.keys())
 
     def _open(self, path: str) -> Any:
-        d: Any = self.repo
-        for frag in path.split("/"):
-            if frag == "":
-                continue
-            if frag in d:
-                d = d[frag]
-            else:
-                return None
-        return d
+        # single flat lookup instead of walking the nested repo per fragment
+        hit = self._index.get(path)
+        if hit is not None:
+            return hit
+        if "/" in path:
+            # tolerate empty fragments (leading/trailing/doubled slashes),
+            # which the per-fragment walk used to skip silently
+            canonical = "/".join(frag for frag in path.split("/") if frag != "")
+            if canonical != path:
+                return self._index.get(canonical)
+        return None
@@ -10,6 +10,8 @@ Note: The `functions` parameter is kept for backward compatibility but is
 not used - the Rust parser has built-in functions (choice, range, sort, etc.).
 """
 
+import functools
+import re
 import sys
 from typing import Any, List, Optional
 
@@ -38,6 +40,54 @@ except ImportError:
     print("Error: Rust parser extension not found. Please build the Rust extension with 'maturin build --release'.")
     sys.exit(1)
 
+# Matches function-evaluation errors surfaced by the Rust parser; compiled
+# once instead of on every exception path in parse_rule.
+_EVAL_ERR_RE = re.compile(r"((?:OverflowError|ValueError|TypeError|Error) while evaluating.*)")
+
+# The Rust parser emits override/value types as indexes into these tuples
+# (see parse_to_dict in rust/python/parser); a tuple subscript is one
+# bytecode versus hashing a string key per parsed override. Order must match
+# the Rust side. LIST_EXTENSION (index 6) has no ValueType: it is rewritten
+# to EXTEND_LIST/ELEMENT during conversion.
+_OVERRIDE_TYPES = (
+    OverrideType.CHANGE,
+    OverrideType.ADD,
+    OverrideType.FORCE_ADD,
+    OverrideType.DEL,
+    OverrideType.EXTEND_LIST,
+)
+
+_VALUE_TYPES = (
+    ValueType.ELEMENT,
+    ValueType.CHOICE_SWEEP,
+    ValueType.SIMPLE_CHOICE_SWEEP,
+    ValueType.GLOB_CHOICE_SWEEP,
+    ValueType.RANGE_SWEEP,
+    ValueType.INTERVAL_SWEEP,
+    None,
+)
+
+# Exact types that _convert_rust_value passes through untouched; checked
+# first since scalars dominate parsed value trees
+_FAST_SCALAR_SET = frozenset((int, float, bool, type(None), str))
+
+# One Rust parser instance (and one memoized raw-parse cache) shared by
+# every OverridesParser built without user functions. create() is called
+# per compose; the parser itself is stateless for parsing, so rebuilding
+# it - and starting a cold parse cache - each time was pure overhead.
+# Per-call state (config_loader, searchpath) lives on the wrapper.
+_SHARED_RUST_PARSER = _rs.OverrideParser()
+_shared_parse_to_dict = functools.lru_cache(maxsize=4096)(_SHARED_RUST_PARSER.parse_to_dict)
+
+_OPERATION_MAP = {
+    "APPEND": ListOperationType.APPEND,
+    "PREPEND": ListOperationType.PREPEND,
+    "INSERT": ListOperationType.INSERT,
+    "REMOVE_AT": ListOperationType.REMOVE_AT,
+    "REMOVE_VALUE": ListOperationType.REMOVE_VALUE,
+    "CLEAR": ListOperationType.CLEAR,
+}
+
 
 class OverridesParser:
     """
@@ -78,12 +128,26 @@ class OverridesParser:
         # Pass functions to Rust parser if provided
         if functions is not None:
             self._rust_parser = _rs.OverrideParser(functions)
+            # User functions may be impure; never memoize their results
+            self._parse_to_dict = self._rust_parser.parse_to_dict
         else:
-            self._rust_parser = _rs.OverrideParser()
+            self._rust_parser = _SHARED_RUST_PARSER
+            # Sweeps repeat the same override strings many times; memoizing
+            # the raw parse turns the repeats into a dict hit, skipping the
+            # FFI crossing and the full Rust parse. Only the frozen Rust dict
+            # is cached - the Override is still built per call below, so
+            # config_loader/searchpath stay per-instance. The cache is shared
+            # module-wide so repeated create() calls start warm.
+            self._parse_to_dict = _shared_parse_to_dict
 
     def _parse_with_rust(self, s: str) -> Override:
         """Parse using Rust parser and convert to Python Override."""
-        data = self._rust_parser.parse_to_dict(s)
+        if "shuffle" in s:
+            # shuffle of a concrete list is evaluated at parse time and must
+            # stay random across repeated parses; bypass the cache
+            data = self._rust_parser.parse_to_dict(s)
+        else:
+            data = self._parse_to_dict(s)
         return _rust_dict_to_override(data, self.config_loader, self.searchpath)
 
     def parse_rule(self, s: str, rule_name: str) -> Any:
@@ -111,20 +175,11 @@ class OverridesParser:
             try:
                 override = self._parse_with_rust(wrapped)
             except Exception as e:
-                # Convert specific evaluation errors to HydraException
-                err_msg = str(e)
-                if (
-                    "Error while evaluating" in err_msg
-                    or "OverflowError while evaluating" in err_msg
-                    or "ValueError while evaluating" in err_msg
-                    or "TypeError while evaluating" in err_msg
-                ):
-                    # Extract the actual error message from the parse error
-                    import re
-
-                    match = re.search(r"((?:OverflowError|ValueError|TypeError|Error) while evaluating.*)", err_msg)
-                    if match:
-                        raise HydraException(match.group(1)) from None
+                # Extract function-evaluation errors in a single scan instead
+                # of four substring probes followed by a search
+                match = _EVAL_ERR_RE.search(str(e))
+                if match:
+                    raise HydraException(match.group(1)) from None
                 # Re-raise with cleaner message
                 raise HydraException(f"Parse error: {e}") from e
             # For extend_list, wrap the values back in ListExtensionOverrideValue
@@ -167,6 +222,17 @@ class OverridesParser:
 
     def parse_overrides(self, overrides: List[str]) -> List[Override]:
         ret: List[Override] = []
+        if len(overrides) > 1:
+            # Parse the whole list in one FFI call instead of crossing the
+            # boundary per string. Any failure falls through to the
+            # per-string loop below, which reports the failing index and
+            # string exactly as before.
+            try:
+                for data in self._rust_parser.parse_many_to_dict(list(overrides)):
+                    ret.append(_rust_dict_to_override(data, self.config_loader, self.searchpath))
+                return ret
+            except Exception:
+                ret = []
         for idx, override in enumerate(overrides):
             try:
                 parsed = self.parse_rule(override, "override")
@@ -214,41 +280,57 @@ def create_functions() -> Functions:
     return functions
 
 
+_KEY_KEYWORDS = {"null": None, "true": True, "false": False}
+
+
 def _convert_dict_key(key: str) -> Any:
     """Convert dict key string to appropriate Python type."""
-    key_lower = key.lower()
-    if key_lower == "null":
-        return None
-    if key_lower == "true":
-        return True
-    if key_lower == "false":
-        return False
-    # Try integer
-    try:
-        return int(key)
-    except ValueError:
-        pass
-    # Try float
-    try:
-        return float(key)
-    except ValueError:
-        pass
+    # Ordinary identifier keys are the common case; only keys that can
+    # plausibly be numeric or keyword literals are worth the parse attempts,
+    # since a failed int()/float() raises and catches a ValueError each.
+    c0 = key[:1]
+    if c0 and c0 in "+-.0123456789":
+        # Try integer
+        try:
+            return int(key)
+        except ValueError:
+            pass
+        # Try float
+        try:
+            return float(key)
+        except ValueError:
+            return key
+    if len(key) <= 8:
+        key_lower = key.lower()
+        if key_lower in _KEY_KEYWORDS:
+            return _KEY_KEYWORDS[key_lower]
+        # letter-initial floats that int()/float() would have accepted
+        if key_lower in ("inf", "infinity", "nan"):
+            return float(key)
     return key
 
 
 def _convert_rust_value(value: Any) -> Any:
     """Convert Rust types to Python types recursively."""
+    # Scalars are by far the most common node; return them after one set probe
+    if type(value) in _FAST_SCALAR_SET:
+        return value
     # Already a Python QuotedString - don't convert again
     if isinstance(value, QuotedString):
         return value
-    # Check if it's a Rust QuotedString (has text/quote/with_quotes but not our type)
-    if hasattr(value, "text") and hasattr(value, "quote") and hasattr(value, "with_quotes"):
+    if isinstance(value, _rs.QuotedString):
         # It's a Rust QuotedString, convert to Python QuotedString
         quote_str = str(value.quote).lower()  # "single" or "double"
         py_quote = Quote.single if quote_str == "single" else Quote.double
         return QuotedString(text=value.text, quote=py_quote)
     elif isinstance(value, list):
         return [_convert_rust_value(item) for item in value]
+    elif isinstance(value, set):
+        # the raw parse dict may come from the shared memoized cache, so
+        # every mutable container must be copied here: handing out e.g. the
+        # cached tags set by identity would let a caller mutating sweep.tags
+        # (as the tag() grammar function does) corrupt later cached parses
+        return {_convert_rust_value(item) for item in value}
     elif isinstance(value, dict):
         return {_convert_dict_key(k): _convert_rust_value(v) for k, v in value.items()}
     else:
@@ -257,15 +339,7 @@ def _convert_rust_value(value: Any) -> Any:
 
 def _parse_list_operation(operation_str: str) -> ListOperationType:
     """Convert list operation string from Rust to Python enum."""
-    operation_map = {
-        "APPEND": ListOperationType.APPEND,
-        "PREPEND": ListOperationType.PREPEND,
-        "INSERT": ListOperationType.INSERT,
-        "REMOVE_AT": ListOperationType.REMOVE_AT,
-        "REMOVE_VALUE": ListOperationType.REMOVE_VALUE,
-        "CLEAR": ListOperationType.CLEAR,
-    }
-    return operation_map.get(operation_str, ListOperationType.APPEND)
+    return _OPERATION_MAP.get(operation_str, ListOperationType.APPEND)
 
 
 def _rust_dict_to_override(
@@ -281,31 +355,32 @@ def _rust_dict_to_override(
         searchpath: Optional searchpath from hydra.searchpath config,
                    used to ensure pkg:// sources are available for glob sweeps
     """
-    # Map override type strings to enum
-    type_map = {
-        "CHANGE": OverrideType.CHANGE,
-        "ADD": OverrideType.ADD,
-        "FORCE_ADD": OverrideType.FORCE_ADD,
-        "DEL": OverrideType.DEL,
-        "EXTEND_LIST": OverrideType.EXTEND_LIST,
-    }
-    override_type = type_map[data["type"]]
-
-    # Map value type strings to enum
-    value_type_map = {
-        "ELEMENT": ValueType.ELEMENT,
-        "CHOICE_SWEEP": ValueType.CHOICE_SWEEP,
-        "SIMPLE_CHOICE_SWEEP": ValueType.SIMPLE_CHOICE_SWEEP,
-        "GLOB_CHOICE_SWEEP": ValueType.GLOB_CHOICE_SWEEP,
-        "RANGE_SWEEP": ValueType.RANGE_SWEEP,
-        "INTERVAL_SWEEP": ValueType.INTERVAL_SWEEP,
-    }
+    # Fast path: plain `key=value` element overrides with scalar values
+    # dominate real command lines. They need no recursive value conversion,
+    # no sweep-dict inspection and no list-operation handling, so the
+    # Override can be built directly from the Rust output.
+    raw = data["value"]
+    if data["value_type"] == 0 and (raw is None or raw.__class__ in (int, float, bool, str)):
+        override = Override(
+            type=_OVERRIDE_TYPES[data["type"]],
+            key_or_group=data["key_or_group"],
+            value_type=None if raw is None else ValueType.ELEMENT,
+            _value=raw,
+            package=data.get("package"),
+            input_line=data.get("input_line"),
+            config_loader=config_loader,
+            searchpath=searchpath,
+        )
+        override.validate()
+        return override
+
+    override_type = _OVERRIDE_TYPES[data["type"]]
 
     # For DEL overrides without value, value_type should be None
     if data["value"] is None:
         value_type: Optional[ValueType] = None
     else:
-        value_type = value_type_map.get(data["value_type"])
+        value_type = _VALUE_TYPES[data["value_type"]]
 
     # Convert value - first convert any Rust types to Python types
     raw_value = _convert_rust_value(data["value"])
@@ -31,7 +31,7 @@ class Quote(Enum):
     double = 1
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QuotedString:
     text: str
 
@@ -80,12 +80,12 @@ class QuotedString:
         return f"{qc}{esc_text}{qc}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Sweep:
     tags: Set[str] = field(default_factory=set)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChoiceSweep(Sweep):
     # simple form: a,b,c
     # explicit form: choices(a,b,c)
@@ -94,7 +94,7 @@ class ChoiceSweep(Sweep):
     shuffle: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class FloatRange:
     start: Union[decimal.Decimal, float]
     stop: Union[decimal.Decimal, float]
@@ -130,7 +130,7 @@ class FloatRange:
             raise HydraException(f"Invalid range values (start:{self.start}, stop:{self.stop}, step:{self.step})")
 
 
-@dataclass
+@dataclass(slots=True)
 class RangeSweep(Sweep):
     """
     Discrete range of numbers
@@ -155,7 +155,7 @@ class RangeSweep(Sweep):
             return FloatRange(start, stop, step)
 
 
-@dataclass
+@dataclass(slots=True)
 class IntervalSweep(Sweep):
     start: Optional[float] = None
     end: Optional[float] = None
@@ -209,14 +209,14 @@ class ListOperationType(Enum):
     CLEAR = 6  # Clear the list
 
 
-@dataclass
+@dataclass(slots=True)
 class Key:
     # the config-group or config dot-path
     key_or_group: str
     package: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Glob:
     include: List[str] = field(default_factory=list)
     exclude: List[str] = field(default_factory=list)
@@ -243,7 +243,7 @@ class Glob:
         return res
 
 
-@dataclass
+@dataclass(slots=True)
 class ListExtensionOverrideValue:
     values: List["ParsedElementType"]
 
@@ -266,7 +266,7 @@ class Transformer:
         return Transformer.str(x)
 
 
-@dataclass
+@dataclass(slots=True)
 class Override:
     # The type of the override (Change, Add or Remove config option or config group choice)
     type: OverrideType
@@ -1,15 +1,16 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import functools
 import importlib
 import importlib.util
-import inspect
+import os
 import pkgutil
 import re
 import sys
 import warnings
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from timeit import default_timer as timer
-from typing import Any, Dict, List, Optional, Tuple, Type
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
 
 from omegaconf import DictConfig
 
@@ -29,6 +30,33 @@ if sys.version_info < (3, 10):
 else:
     from importlib.metadata import entry_points
 
+@functools.cache
+def _get_internal_utils() -> Any:
+    # deferred to break the import cycle with lerna._internal.utils, but
+    # cached so instantiation doesn't pay the import-machinery lock per call
+    from lerna._internal import utils as internal_utils
+
+    return internal_utils
+
+
+@functools.cache
+def _all_entry_points() -> Any:
+    """
+    Fetch the entry points of every installed distribution exactly once per
+    process. ``entry_points()`` re-reads distribution metadata from disk on
+    each call, and ``Plugins._initialize`` runs on every Singleton
+    construction (once per test with the Singleton-resetting conftest).
+    """
+    return entry_points()
+
+
+# Approved top-level module prefixes for plugin classes
+_TOPLEVEL_PLUGIN_PREFIXES = (
+    "lerna_plugins.",
+    "hydra_plugins.",
+    "lerna._internal.core_plugins.",
+)
+
 PLUGIN_TYPES: List[Type[Plugin]] = [
     Plugin,
     ConfigSource,
@@ -39,6 +67,17 @@ PLUGIN_TYPES: List[Type[Plugin]] = [
 ]
 
 
+# Per-module import timing is diagnostic-only; skip the timer calls and dict
+# writes on the scan hot path unless explicitly requested.
+_COLLECT_STATS = bool(os.environ.get("LERNA_SCAN_STATS"))
+
+# Scan results keyed by the names of the top-level modules scanned. The
+# class objects are identical across scans (the modules themselves live in
+# sys.modules), so re-walking the namespace packages on every Singleton
+# construction - e.g. once per test - repeats pure filesystem work.
+_SCAN_CACHE: Dict[Tuple[str, ...], List[Type[Plugin]]] = {}
+
+
 @dataclass
 class ScanStats:
     total_time: float = 0
@@ -55,15 +94,52 @@ class Plugins(metaclass=Singleton):
 
     def __init__(self) -> None:
         self.plugin_type_to_subclass_list: Dict[Type[Plugin], List[Type[Plugin]]] = {}
+        # set twin of plugin_type_to_subclass_list for O(1) dedupe; the list
+        # keeps registration order for discover()
+        self._plugin_type_to_subclass_set: Dict[Type[Plugin], Set[Type[Plugin]]] = {}
         self.class_name_to_class: Dict[str, Type[Plugin]] = {}
+        # per-type discover() results; registration is rare, discovery is per
+        # launch, so snapshot the subclass lists as immutable tuples
+        self._discover_cache: Dict[Type[Plugin], Tuple[Type[Plugin], ...]] = {}
         self.stats: Optional[ScanStats] = None
+        # External plugin discovery (lerna_plugins / hydra_plugins namespaces
+        # and entry points) is deferred until a plugin is actually looked up;
+        # apps that never configure a custom launcher/sweeper/search path
+        # don't pay for it at all.
+        self._external_loaded = False
         self._initialize()
 
     def _initialize(self) -> None:
-        top_level: List[Any] = []
+        self.plugin_type_to_subclass_list = {}
+        self._plugin_type_to_subclass_set = {}
+        self.class_name_to_class = {}
+        # ConfigSource classes already handed to SourcesRegistry
+        self._registered_sources: Set[Type[Plugin]] = set()
+        self._discover_cache.clear()
+
         core_plugins = importlib.import_module("lerna._internal.core_plugins")
-        top_level.append(core_plugins)
+        scanned_plugins, self.stats = self._scan_all_plugins(modules=[core_plugins])
+        for clazz in scanned_plugins:
+            self._register(clazz)
+
+        # The scan imports each plugin module at most once per process, so the
+        # module-level ConfigStore registrations in the core plugins run only
+        # for the first Plugins construction. The singleton is rebuilt against
+        # a fresh ConfigStore on every Singleton.set_state (once per test),
+        # so replay those registrations explicitly instead of relying on
+        # import side effects. Imported here, not at module level: the plugin
+        # modules import lerna.core transitively.
+        from lerna._internal.core_plugins import basic_launcher, basic_sweeper
+
+        basic_launcher._register_config()
+        basic_sweeper._register_config()
 
+    def _ensure_external(self) -> None:
+        if self._external_loaded:
+            return
+        self._external_loaded = True
+
+        top_level: List[Any] = []
         # Support both lerna_plugins and hydra_plugins for backward compatibility
         for plugin_namespace in ["lerna_plugins", "hydra_plugins"]:
             try:
@@ -73,14 +149,17 @@ class Plugins(metaclass=Singleton):
                 # If no plugins are installed the plugins package does not exist.
                 pass
 
-        self.plugin_type_to_subclass_list = defaultdict(list)
-        self.class_name_to_class = {}
-
-        scanned_plugins, self.stats = self._scan_all_plugins(modules=top_level)
+        scanned_plugins, external_stats = self._scan_all_plugins(modules=top_level)
         scanned_plugins.extend(_scan_entrypoint_search_path_plugins())
         for clazz in scanned_plugins:
             self._register(clazz)
 
+        # fold the deferred scan into the stats collected at construction
+        if self.stats is not None:
+            self.stats.total_time += external_stats.total_time
+            self.stats.total_modules_import_time += external_stats.total_modules_import_time
+            self.stats.modules_import_time.update(external_stats.modules_import_time)
+
     def register(self, clazz: Type[Plugin]) -> None:
         """
         Call Plugins.instance().register(MyPlugin) to manually register a plugin class.
@@ -91,18 +170,24 @@ class Plugins(metaclass=Singleton):
 
     def _register(self, clazz: Type[Plugin]) -> None:
         assert _is_concrete_plugin_type(clazz)
+        self._discover_cache.clear()
         for plugin_type in PLUGIN_TYPES:
             if issubclass(clazz, plugin_type):
-                if clazz not in self.plugin_type_to_subclass_list[plugin_type]:
-                    self.plugin_type_to_subclass_list[plugin_type].append(clazz)
-        name = f"{clazz.__module__}.{clazz.__name__}"
+                registered = self._plugin_type_to_subclass_set.setdefault(plugin_type, set())
+                if clazz not in registered:
+                    registered.add(clazz)
+                    self.plugin_type_to_subclass_list.setdefault(plugin_type, []).append(clazz)
+        # interned: the same name arrives again as a lookup key in
+        # _instantiate, where identity lets the dict skip the char compare
+        name = sys.intern(f"{clazz.__module__}.{clazz.__name__}")
         self.class_name_to_class[name] = clazz
-        if issubclass(clazz, ConfigSource):
+        if issubclass(clazz, ConfigSource) and clazz not in self._registered_sources:
+            self._registered_sources.add(clazz)
             SourcesRegistry.instance().register(clazz)
 
     def _instantiate(self, config: DictConfig) -> Plugin:
-        from lerna._internal import utils as internal_utils
-
+        self._ensure_external()
+        internal_utils = _get_internal_utils()
         classname = internal_utils._get_cls_name(config, pop=False)
         try:
             if classname is None:
@@ -113,7 +198,8 @@ class Plugins(metaclass=Singleton):
                 # For plugins outside of lerna-core, the approved module is lerna_plugins or hydra_plugins.
                 raise RuntimeError(f"Invalid plugin '{classname}': not in lerna_plugins or hydra_plugins package")
 
-            if classname not in self.class_name_to_class.keys():
+            classname = sys.intern(classname)
+            if classname not in self.class_name_to_class:
                 raise RuntimeError(f"Unknown plugin class : '{classname}'")
             clazz = self.class_name_to_class[classname]
             plugin = instantiate(config=config, _target_=clazz)
@@ -126,12 +212,9 @@ class Plugins(metaclass=Singleton):
 
     @staticmethod
     def is_in_toplevel_plugins_module(clazz: str) -> bool:
-        return (
-            clazz.startswith("lerna_plugins.")
-            or clazz.startswith("hydra_plugins.")
-            or clazz.startswith("lerna._internal.core_plugins.")
-            or clazz.startswith("lerna._internal.core_plugins.")
-        )
+        # single C-level startswith over a tuple; the old chain also checked
+        # the core_plugins prefix twice
+        return clazz.startswith(_TOPLEVEL_PLUGIN_PREFIXES)
 
     def instantiate_sweeper(
         self,
@@ -167,72 +250,111 @@ class Plugins(metaclass=Singleton):
     def _scan_all_plugins(
         modules: List[Any],
     ) -> Tuple[List[Type[Plugin]], ScanStats]:
+        cache_key = tuple(mdl.__name__ for mdl in modules)
+        cached = _SCAN_CACHE.get(cache_key)
+        if cached is not None:
+            # nothing is imported on a hit, so fresh (all-zero) stats are
+            # accurate; copy the list since callers extend it
+            return list(cached), ScanStats()
+
         stats = ScanStats()
         stats.total_time = timer()
 
         scanned_plugins: List[Type[Plugin]] = []
 
+        # Phase 1: enumerate candidate modules (filesystem metadata only).
+        candidates: List[str] = []
         for mdl in modules:
-            for importer, modname, ispkg in pkgutil.walk_packages(path=mdl.__path__, prefix=mdl.__name__ + ".", onerror=lambda x: None):
-                try:
-                    module_name = modname.rsplit(".", 1)[-1]
-                    # If module's name starts with "_", do not load the module.
-                    # But if the module's name starts with a "__", then load the
-                    # module.
-                    if module_name.startswith("_") and not module_name.startswith("__"):
+            # walk_packages listdirs every namespace subdir and resolves a
+            # spec per entry; the result is stable for the lifetime of the
+            # module object, so stash it there and reuse it when the same
+            # package is scanned again (e.g. in a different modules set)
+            walked = getattr(mdl, "_lerna_walk_cache", None)
+            if walked is None:
+                walked = list(pkgutil.walk_packages(path=mdl.__path__, prefix=mdl.__name__ + ".", onerror=lambda x: None))
+                mdl._lerna_walk_cache = walked
+            for importer, modname, ispkg in walked:
+                module_name = modname.rsplit(".", 1)[-1]
+                # If module's name starts with "_", do not load the module.
+                # But if the module's name starts with a "__", then load the
+                # module.
+                if module_name.startswith("_") and not module_name.startswith("__"):
+                    continue
+                candidates.append(modname)
+
+        # Phase 2: import missing modules on a small thread pool. exec_module
+        # time is dominated by disk reads and CPython's import locks are
+        # per-module, so overlapping the I/O shortens cold scans. Modules
+        # already in sys.modules (e.g. from a previous scan) are not imported
+        # - or executed - again.
+        to_import = [modname for modname in candidates if modname not in sys.modules]
+        import_errors: Dict[str, ImportError] = {}
+        if to_import:
+
+            def _import_one(name: str) -> float:
+                if not _COLLECT_STATS:
+                    importlib.import_module(name)
+                    return 0.0
+                t0 = timer()
+                importlib.import_module(name)
+                return timer() - t0
+
+            # catch_warnings swaps the process-wide warning machinery, so
+            # warnings raised on the workers are recorded too; per-module
+            # attribution is gone, hence the generic header below
+            with warnings.catch_warnings(record=True) as recorded_warnings:
+                with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 2)) as pool:
+                    futures = {modname: pool.submit(_import_one, modname) for modname in to_import}
+                for modname, future in futures.items():
+                    try:
+                        import_time = future.result()
+                    except ImportError as e:
+                        import_errors[modname] = e
                         continue
-                    import_time = timer()
-
-                    with warnings.catch_warnings(record=True) as recorded_warnings:
-                        if sys.version_info < (3, 10):
-                            m = importer.find_module(modname)  # type: ignore
-                            assert m is not None
-                            loaded_mod = m.load_module(modname)
-                        else:
-                            spec = importer.find_spec(modname)  # type: ignore[call-arg]
-                            assert spec is not None
-                            if modname in sys.modules:
-                                loaded_mod = sys.modules[modname]
-                            else:
-                                loaded_mod = importlib.util.module_from_spec(spec)
-                            if loaded_mod is not None:
-                                assert spec.loader is not None
-                                spec.loader.exec_module(loaded_mod)
-                                sys.modules[modname] = loaded_mod
-
-                    import_time = timer() - import_time
-                    if len(recorded_warnings) > 0:
-                        sys.stderr.write(f"[Hydra plugins scanner] : warnings from '{modname}'. Please report to plugin author.\n")
-                        for w in recorded_warnings:
-                            warnings.showwarning(
-                                message=w.message,
-                                category=w.category,
-                                filename=w.filename,
-                                lineno=w.lineno,
-                                file=w.file,
-                                line=w.line,
-                            )
-
-                    stats.total_modules_import_time += import_time
-
-                    assert modname not in stats.modules_import_time
-                    stats.modules_import_time[modname] = import_time
-
-                    if loaded_mod is not None:
-                        for name, obj in inspect.getmembers(loaded_mod):
-                            if _is_concrete_plugin_type(obj):
-                                scanned_plugins.append(obj)
-                except ImportError as e:
-                    warnings.warn(
-                        message=f"\n"
-                        f"\tError importing '{modname}'.\n"
-                        f"\tPlugin is incompatible with this Hydra version or buggy.\n"
-                        f"\tRecommended to uninstall or upgrade plugin.\n"
-                        f"\t\t{type(e).__name__} : {e}",
-                        category=UserWarning,
+                    if _COLLECT_STATS:
+                        stats.total_modules_import_time += import_time
+                        # walk_packages yields each module once, so a plain
+                        # write suffices; no duplicate-key assert/double hash
+                        stats.modules_import_time[modname] = import_time
+
+            if len(recorded_warnings) > 0:
+                sys.stderr.write("[Hydra plugins scanner] : warnings while importing plugins. Please report to plugin author.\n")
+                for w in recorded_warnings:
+                    warnings.showwarning(
+                        message=w.message,
+                        category=w.category,
+                        filename=w.filename,
+                        lineno=w.lineno,
+                        file=w.file,
+                        line=w.line,
                     )
 
+        # Phase 3: collect plugin classes serially, in walk order.
+        for modname in candidates:
+            e = import_errors.get(modname)
+            if e is not None:
+                warnings.warn(
+                    message=f"\n"
+                    f"\tError importing '{modname}'.\n"
+                    f"\tPlugin is incompatible with this Hydra version or buggy.\n"
+                    f"\tRecommended to uninstall or upgrade plugin.\n"
+                    f"\t\t{type(e).__name__} : {e}",
+                    category=UserWarning,
+                )
+                continue
+            loaded_mod = sys.modules.get(modname)
+            if loaded_mod is not None:
+                # vars() iterates the module dict directly;
+                # inspect.getmembers would sort every name and
+                # getattr each one, dunders included
+                for name, obj in vars(loaded_mod).items():
+                    if name.startswith("_"):
+                        continue
+                    if _is_concrete_plugin_type(obj):
+                        scanned_plugins.append(obj)
+
         stats.total_time = timer() - stats.total_time
+        _SCAN_CACHE[cache_key] = list(scanned_plugins)
         return scanned_plugins, stats
 
     def get_stats(self) -> Optional[ScanStats]:
@@ -244,42 +366,73 @@ class Plugins(metaclass=Singleton):
         :return: a list of plugins implementing the plugin type (or all if plugin type is None)
         """
         Plugins.check_usage(self)
-        ret: List[Type[Plugin]] = []
+        self._ensure_external()
         if plugin_type is None:
             plugin_type = Plugin
         assert issubclass(plugin_type, Plugin)
-        if plugin_type not in self.plugin_type_to_subclass_list:
-            return []
-        for clazz in self.plugin_type_to_subclass_list[plugin_type]:
-            ret.append(clazz)
-
-        return ret
+        cached = self._discover_cache.get(plugin_type)
+        if cached is None:
+            cached = tuple(self.plugin_type_to_subclass_list.get(plugin_type, ()))
+            self._discover_cache[plugin_type] = cached
+        return list(cached)
 
     @staticmethod
     def check_usage(self_: Any) -> None:
         if not isinstance(self_, Plugins):
-            raise ValueError(f"Plugins is now a Singleton. usage: Plugins.instance().{inspect.stack()[1][3]}(...)")
+            # sys._getframe is O(1); inspect.stack() walks and materializes
+            # the entire call stack just to name the caller
+            caller = sys._getframe(1).f_code.co_name
+            raise ValueError(f"Plugins is now a Singleton. usage: Plugins.instance().{caller}(...)")
+
+
+# Verdicts keyed by the class object itself (identity hash). The predicate
+# runs once per attribute of every scanned module, so the issubclass +
+# __abstractmethods__ probe is worth paying only once per class.
+_concrete_plugin_cache: Dict[type, bool] = {}
 
 
 def _is_concrete_plugin_type(obj: Any) -> bool:
-    return inspect.isclass(obj) and issubclass(obj, Plugin) and not inspect.isabstract(obj)
+    if not isinstance(obj, type):
+        return False
+    cached = _concrete_plugin_cache.get(obj)
+    if cached is None:
+        # inspect.isabstract boils down to this __abstractmethods__ probe
+        cached = issubclass(obj, Plugin) and not getattr(obj, "__abstractmethods__", ())
+        _concrete_plugin_cache[obj] = cached
+    return cached
+
+
+_SANITIZE_RE = re.compile(r"[^0-9a-zA-Z_]")
+_SANITIZE_TABLE = {c: "_" for c in range(128) if not (chr(c).isalnum() or chr(c) == "_")}
 
 
 def _sanitize_entrypoint_name(name: str) -> str:
-    return re.sub(r"[^0-9a-zA-Z_]", "_", name)
+    # entry-point names are almost always ASCII; str.translate replaces the
+    # disallowed characters without a regex pass or per-call pattern lookup
+    if name.isascii():
+        return name.translate(_SANITIZE_TABLE)
+    return _SANITIZE_RE.sub("_", name)
 
 
-def _is_pkg_path_available(pkg_path: str) -> bool:
-    """Check whether a pkg:// path refers to an importable Python package."""
-    # Convert path separators to dots for importlib
-    module_path = pkg_path.replace("/", ".")
+_find_spec_cached = functools.lru_cache(maxsize=None)(importlib.util.find_spec)
+
+
+@functools.lru_cache(maxsize=None)
+def _module_path_available(module_path: str) -> bool:
     try:
-        spec = importlib.util.find_spec(module_path)
-        return spec is not None
+        return _find_spec_cached(module_path) is not None
     except (ModuleNotFoundError, ValueError):
         return False
 
 
+def _is_pkg_path_available(pkg_path: str) -> bool:
+    """Check whether a pkg:// path refers to an importable Python package."""
+    # Normalize path separators to dots before the cache lookup so that
+    # pkg:foo/bar and pkg:foo.bar hit the same key; find_spec walks every
+    # sys.path finder on each miss and is worth amortizing per process.
+    return _module_path_available(pkg_path.replace("/", "."))
+
+
 def _scan_entrypoint_search_path_plugins() -> List[Type[Plugin]]:
     """
     Discover SearchPathPlugin classes registered via the ``hydra.lernaplugins``
@@ -301,12 +454,21 @@ def _scan_entrypoint_search_path_plugins() -> List[Type[Plugin]]:
     """
     scanned_plugins: List[Type[Plugin]] = []
 
-    discovered: List[Any] = []
-    for group in ("hydra.lernaplugins", "lerna.plugins"):
-        try:
-            discovered.extend(entry_points(group=group))
-        except TypeError:
-            discovered.extend(entry_points().get(group, []))  # type: ignore[arg-type]
+    # One pass over all entry points instead of a select() per group: each
+    # select() re-walks the full EntryPoints collection.
+    eps = _all_entry_points()
+    wanted = ("hydra.lernaplugins", "lerna.plugins")
+    if isinstance(eps, dict):
+        # 3.10/3.11 SelectableGroups (and the older plain-dict return):
+        # flat iteration would yield group names, so query per group
+        select = getattr(eps, "select", None)
+        if select is not None:
+            discovered: List[Any] = [ep for group in wanted for ep in select(group=group)]
+        else:
+            discovered = [ep for group in wanted for ep in eps.get(group, [])]
+    else:
+        # 3.12+ EntryPoints is a flat iterable of EntryPoint
+        discovered = [ep for ep in eps if ep.group in wanted]
 
     for entry_point in discovered:
         if entry_point.value.startswith(("pkg:", "file:")):
@@ -349,7 +511,9 @@ def _scan_entrypoint_search_path_plugins() -> List[Type[Plugin]]:
         # Only register lerna-native SearchPathPlugin subclasses.
         # Hydra SearchPathPlugin subclasses are handled by the hydra bridge
         # (hydra_plugins/lerna/searchpath.py) and should not be double-registered.
-        for _, obj in inspect.getmembers(module):
+        for attr_name, obj in vars(module).items():
+            if attr_name.startswith("_"):
+                continue
             if _is_concrete_plugin_type(obj) and issubclass(obj, SearchPathPlugin):
                 scanned_plugins.append(obj)
 
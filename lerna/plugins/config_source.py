@@ -2,7 +2,7 @@
 import re
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from omegaconf import Container
 
@@ -91,23 +91,32 @@ class ConfigSource(Plugin):
 
     def _list_add_result(
         self,
-        files: List[str],
+        files: Set[str],
         file_path: str,
         file_name: str,
         results_filter: Optional[ObjectType],
+        is_file: Optional[bool] = None,
+        is_dir: Optional[bool] = None,
     ) -> None:
         filtered = ["__pycache__", "__init__.py"]
-        is_group = self.is_group(file_path)
-        is_config = self.is_config(file_path)
+        # is_file/is_dir hints let directory scans (os.scandir) classify
+        # entries without re-statting each one. The is_file hint only matches
+        # is_config semantics when the name already carries the .yaml
+        # extension; otherwise is_config probes a different file name.
+        is_group = self.is_group(file_path) if is_dir is None else is_dir
+        if is_file is not None and file_name.endswith(".yaml"):
+            is_config = is_file
+        else:
+            is_config = self.is_config(file_path)
         if is_group and (results_filter is None or results_filter == ObjectType.GROUP) and file_name not in filtered:
-            files.append(file_name)
+            files.add(file_name)
         if is_config and file_name not in filtered and (results_filter is None or results_filter == ObjectType.CONFIG):
             # strip extension
             last_dot = file_name.rfind(".")
             if last_dot != -1:
                 file_name = file_name[0:last_dot]
 
-            files.append(file_name)
+            files.add(file_name)
 
     def full_path(self) -> str:
         return f"{self.scheme()}://{self.path}"
@@ -1,4 +1,5 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import functools
 from dataclasses import dataclass
 
 from omegaconf import MISSING, DictConfig
@@ -12,8 +13,9 @@ class TestConfig:
     param: int = MISSING
 
 
-config_store = ConfigStore.instance()
-config_store.store(group="test", name="default", node=TestConfig)
+@functools.cache
+def _register() -> None:
+    ConfigStore.instance().store(group="test", name="default", node=TestConfig)
 
 
 @lerna.main(version_base=None, config_path=".", config_name="config")
@@ -22,4 +24,7 @@ def run(config: DictConfig) -> None:
 
 
 if __name__ == "__main__":
+    # must run before run() composes the config (the defaults list pulls in
+    # test/default), but not at plain import time
+    _register()
     run()
@@ -14,6 +14,7 @@ from pytest import fixture, mark, param, raises, warns
 from lerna import (
     __version__,
     compose,
+    compose_cached,
     initialize,
     initialize_config_dir,
     initialize_config_module,
@@ -262,6 +263,48 @@ class TestComposeInits:
             assert ret == expected
 
 
+class TestComposeCached:
+    config_path = "../../examples/jupyter_notebooks/cloud_app/conf"
+
+    @fixture(autouse=True)
+    def _clear_compose_cache(self) -> Any:
+        compose_cached.cache_clear()
+        yield
+        compose_cached.cache_clear()
+
+    def test_repeat_call_is_served_from_cache(self, hydra_restore_singletons: Any, monkeypatch: Any) -> None:
+        compose_module = sys.modules["lerna.compose"]
+        real_compose = compose_module.compose
+        calls: List[int] = []
+
+        def counting_compose(*args: Any, **kwargs: Any) -> Any:
+            calls.append(1)
+            return real_compose(*args, **kwargs)
+
+        monkeypatch.setattr(compose_module, "compose", counting_compose)
+        with initialize(version_base=None, config_path=self.config_path):
+            ret1 = compose_cached("config", ["db=mysql"])
+            ret2 = compose_cached("config", ["db=mysql"])
+            assert len(calls) == 1
+            assert ret1 == ret2
+            # the documented invalidation hook drops the cached entry
+            compose_cached.cache_clear()
+            compose_cached("config", ["db=mysql"])
+            assert len(calls) == 2
+
+    def test_returned_copy_is_isolated(self, hydra_restore_singletons: Any) -> None:
+        with initialize(version_base=None, config_path=self.config_path):
+            ret1 = compose_cached("config", ["db=mysql"])
+            ret1.db.driver = "changed"
+            ret2 = compose_cached("config", ["db=mysql"])
+            assert ret2.db.driver == "mysql"
+
+    def test_distinct_overrides_are_distinct_entries(self, hydra_restore_singletons: Any) -> None:
+        with initialize(version_base=None, config_path=self.config_path):
+            assert compose_cached("config", ["db=mysql"]).db.driver == "mysql"
+            assert compose_cached("config", ["db=sqlite"]).db.driver == "sqlite"
+
+
 def test_initialize_ctx_with_absolute_dir(hydra_restore_singletons: Any, tmpdir: Any) -> None:
     with raises(HydraException, match=re.escape("config_path in initialize() must be relative")):
         with initialize(version_base=None, config_path=str(tmpdir)):
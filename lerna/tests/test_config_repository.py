@@ -16,7 +16,7 @@ from lerna._internal.core_plugins.structured_config_source import StructuredConf
 from lerna.core.default_element import GroupDefault, InputDefault
 from lerna.core.plugins import Plugins
 from lerna.core.singleton import Singleton
-from lerna.plugins.config_source import ConfigSource
+from lerna.plugins.config_source import ConfigLoadError, ConfigSource
 from lerna.test_utils.config_source_common_tests import ConfigSourceTestSuite
 from lerna.test_utils.test_utils import chdir_hydra_root
 
@@ -169,6 +169,21 @@ def test_get_config_header(cfg_text: str, expected: Any, sep: str) -> None:
             ConfigSource._get_header_dict(cfg_text)
 
 
+def test_file_config_source_load_configs() -> None:
+    src = FileConfigSource(provider="test", path="file://lerna/tests/test_apps/config_source_test/dir")
+    results = src.load_configs(["dataset/imagenet", "dataset/cifar10"])
+    assert [ret.config for ret in results] == [
+        {"name": "imagenet", "path": "/datasets/imagenet"},
+        {"name": "cifar10", "path": "/datasets/cifar10"},
+    ]
+    # batch results match the single-file API
+    single = src.load_config("dataset/imagenet")
+    assert results[0].config == single.config
+    assert results[0].header == single.header
+    with raises(ConfigLoadError):
+        src.load_configs(["dataset/not_found"])
+
+
 def test_singleton_get_state(hydra_restore_singletons: Any) -> None:
     s = Singleton.get_state()
     assert Plugins not in s["instances"]
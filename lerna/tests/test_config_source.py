@@ -1,7 +1,7 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 """Tests for ConfigSource Rust bindings."""
 
-import tempfile
+import os
 from pathlib import Path
 
 import pytest
@@ -66,95 +66,103 @@ class TestConfigResult:
 class TestRustFileConfigSource:
     """Test RustFileConfigSource - Rust FileConfigSource exposed to Python."""
 
-    def test_file_config_source_scheme(self):
+    def test_file_config_source_scheme(self, tmp_path: Path):
         """FileConfigSource reports 'file' scheme."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source = RustFileConfigSource(provider="file", path=tmpdir)
-            assert source.scheme() == "file"
+        source = RustFileConfigSource(provider="file", path=str(tmp_path))
+        assert source.scheme() == "file"
 
-    def test_file_config_source_path(self):
+    def test_file_config_source_path(self, tmp_path: Path):
         """FileConfigSource reports its path."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source = RustFileConfigSource(provider="file", path=tmpdir)
-            assert source.path() == tmpdir
+        source = RustFileConfigSource(provider="file", path=str(tmp_path))
+        assert source.path() == str(tmp_path)
 
-    def test_file_config_source_available(self):
+    def test_file_config_source_available(self, tmp_path: Path):
         """FileConfigSource is available when path exists."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source = RustFileConfigSource(provider="file", path=tmpdir)
-            assert source.available() is True
+        source = RustFileConfigSource(provider="file", path=str(tmp_path))
+        assert source.available() is True
 
     def test_file_config_source_unavailable(self):
         """FileConfigSource unavailable when path doesn't exist."""
         source = RustFileConfigSource(provider="file", path="/nonexistent/path/12345")
         assert source.available() is False
 
-    def test_file_config_source_is_group(self):
+    def test_file_config_source_is_group(self, tmp_path: Path):
         """FileConfigSource.is_group identifies directories."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a subdirectory (group)
-            group_path = Path(tmpdir) / "db"
-            group_path.mkdir()
+        # Create a subdirectory (group)
+        (tmp_path / "db").mkdir()
 
-            source = RustFileConfigSource(provider="file", path=tmpdir)
-            assert source.is_group("db") is True
-            assert source.is_group("nonexistent") is False
+        source = RustFileConfigSource(provider="file", path=str(tmp_path))
+        assert source.is_group("db") is True
+        assert source.is_group("nonexistent") is False
 
-    def test_file_config_source_is_config(self):
+    def test_file_config_source_is_config(self, tmp_path: Path):
         """FileConfigSource.is_config identifies config files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a config file
-            config_file = Path(tmpdir) / "config.yaml"
-            config_file.write_text("key: value\n")
+        # Create a config file
+        (tmp_path / "config.yaml").write_text("key: value\n")
 
-            source = RustFileConfigSource(provider="file", path=tmpdir)
-            assert source.is_config("config.yaml") is True
-            assert source.is_config("nonexistent.yaml") is False
+        source = RustFileConfigSource(provider="file", path=str(tmp_path))
+        assert source.is_config("config.yaml") is True
+        assert source.is_config("nonexistent.yaml") is False
 
-    def test_file_config_source_list_empty(self):
+    def test_file_config_source_list_empty(self, tmp_path: Path):
         """FileConfigSource.list returns empty for nonexistent group."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source = RustFileConfigSource(provider="file", path=tmpdir)
-            result = source.list("nonexistent")
-            assert result == []
+        source = RustFileConfigSource(provider="file", path=str(tmp_path))
+        result = source.list("nonexistent")
+        assert result == []
 
-    def test_file_config_source_list_contents(self):
+    def test_file_config_source_list_contents(self, tmp_path: Path):
         """FileConfigSource.list returns directory contents."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create some files and dirs
-            (Path(tmpdir) / "config.yaml").write_text("key: value\n")
-            (Path(tmpdir) / "db").mkdir()
-            (Path(tmpdir) / "db" / "mysql.yaml").write_text("driver: mysql\n")
+        # Create some files and dirs
+        (tmp_path / "config.yaml").write_text("key: value\n")
+        (tmp_path / "db").mkdir()
+        (tmp_path / "db" / "mysql.yaml").write_text("driver: mysql\n")
 
-            source = RustFileConfigSource(provider="file", path=tmpdir)
+        source = RustFileConfigSource(provider="file", path=str(tmp_path))
 
-            # List root - Hydra convention: entries without .yaml extension
-            root_contents = source.list("")
-            assert "config" in root_contents
-            assert "db" in root_contents
+        # List root - Hydra convention: entries without .yaml extension
+        root_contents = source.list("")
+        assert "config" in root_contents
+        assert "db" in root_contents
 
-            # List db group
-            db_contents = source.list("db")
-            assert "mysql" in db_contents
+        # List db group
+        db_contents = source.list("db")
+        assert "mysql" in db_contents
 
-    def test_file_config_source_load_config(self):
+    def test_file_config_source_load_config(self, tmp_path: Path):
         """FileConfigSource.load_config loads YAML files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_file = Path(tmpdir) / "test.yaml"
-            config_file.write_text("""
+        config_file = tmp_path / "test.yaml"
+        config_file.write_text("""
 server:
   host: localhost
   port: 8080
 debug: true
 """)
-            source = RustFileConfigSource(provider="file", path=tmpdir)
-            result = source.load_config("test.yaml")
+        source = RustFileConfigSource(provider="file", path=str(tmp_path))
+        result = source.load_config("test.yaml")
 
-            assert isinstance(result, ConfigResult)
-            config = result.get_config()
-            assert config["server"]["host"] == "localhost"
-            assert config["server"]["port"] == 8080
-            assert config["debug"] is True
+        assert isinstance(result, ConfigResult)
+        config = result.get_config()
+        assert config["server"]["host"] == "localhost"
+        assert config["server"]["port"] == 8080
+        assert config["debug"] is True
+
+    def test_file_config_source_load_config_cached(self, tmp_path: Path):
+        """Repeated loads are served from the parse cache until the file changes."""
+        config_file = tmp_path / "test.yaml"
+        config_file.write_text("value: 1\n")
+
+        source = RustFileConfigSource(provider="file", path=str(tmp_path))
+        assert source.load_config("test.yaml").get_config() == {"value": 1}
+        assert source.load_config("test.yaml").get_config() == {"value": 1}
+
+        # a changed mtime invalidates the cached parse
+        config_file.write_text("value: 2\n")
+        os.utime(config_file)
+        assert source.load_config("test.yaml").get_config() == {"value": 2}
+
+        # clear_cache forces a reparse as well
+        source.clear_cache()
+        assert source.load_config("test.yaml").get_config() == {"value": 2}
 
 
 class TestConfigSourceManager:
@@ -165,45 +173,42 @@ class TestConfigSourceManager:
         manager = ConfigSourceManager()
         assert manager is not None
 
-    def test_manager_add_rust_source(self):
+    def test_manager_add_rust_source(self, tmp_path: Path):
         """Manager can add a Rust FileConfigSource."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = ConfigSourceManager()
-            manager.add_file_source(provider="file", path=tmpdir)
+        manager = ConfigSourceManager()
+        manager.add_file_source(provider="file", path=str(tmp_path))
 
-            # Should have one source
-            assert manager.len() == 1
+        # Should have one source
+        assert manager.len() == 1
 
-    def test_manager_list_from_source(self):
+    def test_manager_list_from_source(self, tmp_path: Path):
         """Manager can list contents from added sources."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create test structure
-            (Path(tmpdir) / "config.yaml").write_text("key: value\n")
-            (Path(tmpdir) / "db").mkdir()
+        # Create test structure
+        (tmp_path / "config.yaml").write_text("key: value\n")
+        (tmp_path / "db").mkdir()
 
-            manager = ConfigSourceManager()
-            manager.add_file_source(provider="file", path=tmpdir)
+        manager = ConfigSourceManager()
+        manager.add_file_source(provider="file", path=str(tmp_path))
 
-            contents = manager.list_all("")
-            # Files listed without extension by Hydra convention
-            assert "config" in contents
-            assert "db" in contents
+        contents = manager.list_all("")
+        # Files listed without extension by Hydra convention
+        assert "config" in contents
+        assert "db" in contents
 
-    def test_manager_load_config(self):
+    def test_manager_load_config(self, tmp_path: Path):
         """Manager can load config from sources."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_file = Path(tmpdir) / "app.yaml"
-            config_file.write_text("app_name: test\nversion: 1\n")
+        config_file = tmp_path / "app.yaml"
+        config_file.write_text("app_name: test\nversion: 1\n")
 
-            manager = ConfigSourceManager()
-            manager.add_file_source(provider="file", path=tmpdir)
+        manager = ConfigSourceManager()
+        manager.add_file_source(provider="file", path=str(tmp_path))
 
-            # Use config name without extension (Hydra convention)
-            result = manager.load_config("app")
-            assert result is not None
-            config = result.get_config()
-            assert config["app_name"] == "test"
-            assert config["version"] == 1
+        # Use config name without extension (Hydra convention)
+        result = manager.load_config("app")
+        assert result is not None
+        config = result.get_config()
+        assert config["app_name"] == "test"
+        assert config["version"] == 1
 
 
 class TestPythonConfigSource:
@@ -259,96 +264,92 @@ class TestPythonConfigSource:
         config = result.get_config()
         assert config["from_python"] is True
 
-    def test_multiple_sources(self):
+    def test_multiple_sources(self, tmp_path: Path):
         """Manager handles multiple sources (Rust + Python)."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a file in the Rust source
-            (Path(tmpdir) / "rust_config.yaml").write_text("source: rust\n")
+        # Create a file in the Rust source
+        (tmp_path / "rust_config.yaml").write_text("source: rust\n")
 
-            # Create Python source
-            class PySource:
-                def scheme(self):
-                    return "memory"
+        # Create Python source
+        class PySource:
+            def scheme(self):
+                return "memory"
 
-                def provider(self):
-                    return "python"
+            def provider(self):
+                return "python"
 
-                def path(self):
-                    return ""
+            def path(self):
+                return ""
 
-                def available(self):
-                    return True
+            def available(self):
+                return True
 
-                def load_config(self, config_path):
-                    if config_path == "py_config":
-                        return ConfigResult(
-                            provider="python",
-                            path=config_path,
-                            config={"source": "python"},
-                        )
-                    return None
+            def load_config(self, config_path):
+                if config_path == "py_config":
+                    return ConfigResult(
+                        provider="python",
+                        path=config_path,
+                        config={"source": "python"},
+                    )
+                return None
 
-                def is_group(self, group_path):
-                    return False
+            def is_group(self, group_path):
+                return False
 
-                def is_config(self, config_path):
-                    return config_path == "py_config"
+            def is_config(self, config_path):
+                return config_path == "py_config"
 
-                def exists(self, path):
-                    return path == "py_config"
+            def exists(self, path):
+                return path == "py_config"
 
-                def list(self, group_path, results_filter=None):
-                    if group_path == "":
-                        return ["py_config"]
-                    return []
+            def list(self, group_path, results_filter=None):
+                if group_path == "":
+                    return ["py_config"]
+                return []
 
-            manager = ConfigSourceManager()
-            manager.add_file_source(provider="file", path=tmpdir)
-            manager.add_python_source(PySource())
+        manager = ConfigSourceManager()
+        manager.add_file_source(provider="file", path=str(tmp_path))
+        manager.add_python_source(PySource())
 
-            # Both sources should be accessible
-            contents = manager.list_all("")
-            assert "rust_config" in contents
-            assert "py_config" in contents
+        # Both sources should be accessible
+        contents = manager.list_all("")
+        assert "rust_config" in contents
+        assert "py_config" in contents
 
 
 class TestConfigSourceEdgeCases:
     """Test edge cases and error handling."""
 
-    def test_load_nonexistent_config(self):
+    def test_load_nonexistent_config(self, tmp_path: Path):
         """Loading nonexistent config raises OSError."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source = RustFileConfigSource(provider="file", path=tmpdir)
-            with pytest.raises(OSError):
-                source.load_config("nonexistent.yaml")
+        source = RustFileConfigSource(provider="file", path=str(tmp_path))
+        with pytest.raises(OSError):
+            source.load_config("nonexistent.yaml")
 
-    def test_load_invalid_yaml(self):
+    def test_load_invalid_yaml(self, tmp_path: Path):
         """Loading invalid YAML handles errors gracefully."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            bad_file = Path(tmpdir) / "bad.yaml"
-            bad_file.write_text("this: is: not: valid: yaml: : :\n")
-
-            source = RustFileConfigSource(provider="file", path=tmpdir)
-            # Should either return error result or raise
-            try:
-                result = source.load_config("bad.yaml")
-                # If it returns, check it's usable
-                assert result is None or isinstance(result, ConfigResult)
-            except Exception:
-                # Expected - invalid YAML should raise
-                pass
-
-    def test_empty_config(self):
+        bad_file = tmp_path / "bad.yaml"
+        bad_file.write_text("this: is: not: valid: yaml: : :\n")
+
+        source = RustFileConfigSource(provider="file", path=str(tmp_path))
+        # Should either return error result or raise
+        try:
+            result = source.load_config("bad.yaml")
+            # If it returns, check it's usable
+            assert result is None or isinstance(result, ConfigResult)
+        except Exception:
+            # Expected - invalid YAML should raise
+            pass
+
+    def test_empty_config(self, tmp_path: Path):
         """Loading empty config file works."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            empty_file = Path(tmpdir) / "empty.yaml"
-            empty_file.write_text("")
-
-            source = RustFileConfigSource(provider="file", path=tmpdir)
-            # Empty YAML file - check behavior
-            try:
-                result = source.load_config("empty.yaml")
-                assert result is None or isinstance(result, ConfigResult)
-            except OSError:
-                # Also acceptable - empty file may be treated as error
-                pass
+        empty_file = tmp_path / "empty.yaml"
+        empty_file.write_text("")
+
+        source = RustFileConfigSource(provider="file", path=str(tmp_path))
+        # Empty YAML file - check behavior
+        try:
+            result = source.load_config("empty.yaml")
+            assert result is None or isinstance(result, ConfigResult)
+        except OSError:
+            # Also acceptable - empty file may be treated as error
+            pass
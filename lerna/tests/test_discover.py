@@ -6,21 +6,76 @@ This tests the bridge functionality that allows plugins registered via lerna's
 entrypoint system (hydra.lernaplugins) to be discovered by hydra-core.
 """
 
+import sys
 from pathlib import Path
-from subprocess import check_call
 
 import pytest
 from hydra.core.plugins import Plugins as HydraPlugins
 
+from lerna.core import plugins as lerna_core_plugins
+
+_FAKE_PACKAGE_ENTRY_POINTS = {
+    "fake_package": "[hydra.lernaplugins]\nfake-package = fake_package.plugin\n",
+    "fake_package2": "[hydra.lernaplugins]\nfake-package2 = pkg:fake_package2.hydra\n",
+}
 
-@pytest.fixture(scope="module", autouse=True)
-def install_fake_packages():
-    """Install fake test packages that register plugins via entry points."""
-    folder = (Path(__file__).parent / "fake_package").resolve()
-    check_call(["pip", "install", str(folder)])
 
-    folder = (Path(__file__).parent / "fake_package2").resolve()
-    check_call(["pip", "install", str(folder)])
+@pytest.fixture(scope="module", autouse=True)
+def install_fake_packages(tmp_path_factory: pytest.TempPathFactory):
+    """
+    Make the fake test packages discoverable without shelling out to pip.
+
+    The tests only need the packages importable and their entry points
+    visible to ``importlib.metadata``, so point ``sys.path`` at the source
+    trees and write minimal ``.dist-info`` metadata into a temp dir instead
+    of building and installing wheels in a subprocess.
+    """
+    tests_dir = Path(__file__).parent.resolve()
+    dist_dir = tmp_path_factory.mktemp("fake_package_dists")
+
+    for dist_name, entry_points_txt in _FAKE_PACKAGE_ENTRY_POINTS.items():
+        info = dist_dir / f"{dist_name}-0.0.0.dist-info"
+        info.mkdir()
+        (info / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {dist_name.replace('_', '-')}\nVersion: 0.0.0\n")
+        (info / "entry_points.txt").write_text(entry_points_txt)
+
+    # Only the module-style fake_package needs to be importable.
+    # fake_package2 is registered through a pkg: entry point and its hydra
+    # subdir has no __init__.py; putting its source tree on sys.path would
+    # make fake_package2.hydra importable as a namespace package, which is
+    # exactly what a pip install of it does not do.
+    added = [str(tests_dir / "fake_package"), str(dist_dir)]
+    for path in added:
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    _clear_entry_point_caches()
+
+    yield
+
+    for path in added:
+        if path in sys.path:
+            sys.path.remove(path)
+    _clear_entry_point_caches()
+
+
+def _clear_entry_point_caches() -> None:
+    # entry points and pkg-availability verdicts are cached per process and
+    # must be re-derived when sys.path changes
+    lerna_core_plugins._all_entry_points.cache_clear()
+    lerna_core_plugins._module_path_available.cache_clear()
+    lerna_core_plugins._find_spec_cached.cache_clear()
+    # the searchpath bridge keeps its own entry-point cache and injects the
+    # discovered plugin classes into its globals at import time; if it was
+    # imported before the fake dist-info landed on sys.path, reset it so the
+    # next discovery re-derives both
+    searchpath = sys.modules.get("hydra_plugins.lerna.searchpath")
+    if searchpath is not None:
+        searchpath._get_lerna_entry_points.cache_clear()
+        for name in searchpath._discovered_plugin_names:
+            searchpath.__dict__.pop(name, None)
+        searchpath._discovered_plugin_names.clear()
+        searchpath._searchpaths_pkg.clear()
+        searchpath._initialized = False
 
 
 class TestSearchpathPlugin:
@@ -7,55 +7,58 @@ These tests verify fixes for:
 - #2870: importlib-resources 6.2+ compatibility
 """
 
+from dataclasses import dataclass
 from typing import Any
 
 import pytest
 from omegaconf import OmegaConf
+from omegaconf.errors import InterpolationKeyError
 
+from lerna import compose, initialize_config_dir
+from lerna._internal.core_plugins.importlib_resources_config_source import (
+    ImportlibResourcesConfigSource,
+)
 from lerna.core.default_element import (
     ConfigDefault,
     GroupDefault,
     _normalize_path,
 )
+from lerna.core.global_hydra import GlobalHydra
+from lerna.core.override_parser.overrides_parser import OverridesParser
+from lerna.core.override_parser.types import Glob
+from lerna.errors import ConfigCompositionException
+from lerna.utils import instantiate
 
 
 class TestNormalizePath:
     """Test the _normalize_path helper function for Hydra #2878."""
 
-    def test_simple_path(self):
-        """Normal paths should be unchanged."""
-        assert _normalize_path("a/b/c") == "a/b/c"
-
-    def test_empty_path(self):
-        """Empty paths should remain empty."""
-        assert _normalize_path("") == ""
-
-    def test_single_dotdot(self):
-        """Single .. should resolve correctly."""
-        assert _normalize_path("dir1/../dir2") == "dir2"
-
-    def test_multiple_dotdot(self):
-        """Multiple .. should resolve correctly."""
-        assert _normalize_path("a/b/c/../../d") == "a/d"
-
-    def test_dotdot_at_start(self):
-        """.. at start should be ignored (can't go above root)."""
-        assert _normalize_path("../foo") == "foo"
-        assert _normalize_path("../../foo/bar") == "foo/bar"
-
-    def test_dot_segments(self):
-        """Single dots should be removed."""
-        assert _normalize_path("./dir/child") == "dir/child"
-        assert _normalize_path("a/./b/./c") == "a/b/c"
-
-    def test_complex_path(self):
-        """Complex paths with mixed . and .. should resolve correctly."""
-        assert _normalize_path("dir1/../dir2/./child") == "dir2/child"
-        assert _normalize_path("a/b/../c/./d/../e") == "a/c/e"
-
-    def test_empty_segments(self):
-        """Empty segments (double slashes) should be handled."""
-        assert _normalize_path("a//b/c") == "a/b/c"
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            # normal paths are unchanged
+            ("a/b/c", "a/b/c"),
+            # empty paths remain empty
+            ("", ""),
+            # single .. resolves
+            ("dir1/../dir2", "dir2"),
+            # multiple .. resolve
+            ("a/b/c/../../d", "a/d"),
+            # .. at start is ignored (can't go above root)
+            ("../foo", "foo"),
+            ("../../foo/bar", "foo/bar"),
+            # single dots are removed
+            ("./dir/child", "dir/child"),
+            ("a/./b/./c", "a/b/c"),
+            # mixed . and .. resolve
+            ("dir1/../dir2/./child", "dir2/child"),
+            ("a/b/../c/./d/../e", "a/c/e"),
+            # empty segments (double slashes) are handled
+            ("a//b/c", "a/b/c"),
+        ],
+    )
+    def test_normalize_path(self, path: str, expected: str):
+        assert _normalize_path(path) == expected
 
 
 class TestConfigDefaultRelativePaths:
@@ -142,10 +145,6 @@ class TestImportlibResourcesSafeChecks:
 
     def test_safe_is_file_with_orphan_path(self):
         """_safe_is_file should return False for objects without is_file method."""
-        from lerna._internal.core_plugins.importlib_resources_config_source import (
-            ImportlibResourcesConfigSource,
-        )
-
         # Simulate OrphanPath-like object without is_file method
         class OrphanPath:
             pass
@@ -155,10 +154,6 @@ class TestImportlibResourcesSafeChecks:
 
     def test_safe_is_file_with_normal_path(self):
         """_safe_is_file should work normally for objects with is_file method."""
-        from lerna._internal.core_plugins.importlib_resources_config_source import (
-            ImportlibResourcesConfigSource,
-        )
-
         class NormalPath:
             def is_file(self):
                 return True
@@ -168,10 +163,6 @@ class TestImportlibResourcesSafeChecks:
 
     def test_safe_is_dir_with_orphan_path(self):
         """_safe_is_dir should return False for objects without is_dir method."""
-        from lerna._internal.core_plugins.importlib_resources_config_source import (
-            ImportlibResourcesConfigSource,
-        )
-
         class OrphanPath:
             pass
 
@@ -180,10 +171,6 @@ class TestImportlibResourcesSafeChecks:
 
     def test_safe_is_dir_with_normal_path(self):
         """_safe_is_dir should work normally for objects with is_dir method."""
-        from lerna._internal.core_plugins.importlib_resources_config_source import (
-            ImportlibResourcesConfigSource,
-        )
-
         class NormalPath:
             def is_dir(self):
                 return True
@@ -208,9 +195,14 @@ class TestSubfolderAppendIntegration:
     The fix makes CLI appends use absolute paths from root.
     """
 
-    @pytest.fixture
-    def config_dir(self, tmp_path):
-        """Create a config structure similar to Hydra #2935 repro."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def config_dir(cls, tmp_path_factory):
+        """Create a config structure similar to Hydra #2935 repro.
+
+        The tree is immutable, so it is built once per class instead of
+        per test.
+        """
         # Create directory structure exactly matching the bug report:
         # conf/
         #   db/
@@ -219,7 +211,7 @@ class TestSubfolderAppendIntegration:
         #   server/
         #     alpha.yaml (with relative defaults: - db: mysql)
 
-        conf_dir = tmp_path / "conf"
+        conf_dir = tmp_path_factory.mktemp("subfolder_append") / "conf"
         db_dir = conf_dir / "db"
         server_dir = conf_dir / "server"
 
@@ -264,8 +256,6 @@ name: alpha
         Note: The config ends up under the server package because of how
         package inheritance works with configs in subfolders.
         """
-        from lerna import compose, initialize_config_dir
-        from lerna.core.global_hydra import GlobalHydra
 
         GlobalHydra.instance().clear()
 
@@ -300,8 +290,6 @@ class TestGlobPkgSearchpathFix:
         This tests the OverridesParser correctly propagates searchpath
         to Override objects for glob sweep enumeration.
         """
-        from lerna.core.override_parser.overrides_parser import OverridesParser
-        from lerna.core.override_parser.types import Glob
 
         # Create parser with a mock searchpath
         searchpath = ["pkg://some_package/conf"]
@@ -316,8 +304,6 @@ class TestGlobPkgSearchpathFix:
 
     def test_glob_sweep_without_searchpath(self):
         """Verify glob sweep works without searchpath (backward compatibility)."""
-        from lerna.core.override_parser.overrides_parser import OverridesParser
-        from lerna.core.override_parser.types import Glob
 
         # Create parser without searchpath (default behavior)
         parser = OverridesParser.create(config_loader=None)
@@ -342,12 +328,6 @@ class TestInstantiateErrorContext:
 
     def test_interpolation_error_has_full_key(self):
         """Verify interpolation errors during instantiate include full_key."""
-        from dataclasses import dataclass
-
-        from omegaconf.errors import InterpolationKeyError
-
-        from lerna.utils import instantiate
-
         @dataclass
         class TestClass:
             bad_interp: Any
@@ -363,12 +343,6 @@ class TestInstantiateErrorContext:
 
     def test_interpolation_error_has_object_type(self):
         """Verify interpolation errors during instantiate include object_type."""
-        from dataclasses import dataclass
-
-        from omegaconf.errors import InterpolationKeyError
-
-        from lerna.utils import instantiate
-
         @dataclass
         class TestClass:
             bad_interp: Any
@@ -384,12 +358,6 @@ class TestInstantiateErrorContext:
 
     def test_error_message_includes_context(self):
         """Verify the error message string includes full_key and object_type."""
-        from dataclasses import dataclass
-
-        from omegaconf.errors import InterpolationKeyError
-
-        from lerna.utils import instantiate
-
         @dataclass
         class MyClass:
             bad_interp: Any
@@ -553,8 +521,6 @@ remove_me: should_be_gone
         return conf_dir
 
     def test_patch_removes_key_value_and_list_item(self, config_dir):
-        from lerna import compose, initialize_config_dir
-        from lerna.core.global_hydra import GlobalHydra
 
         GlobalHydra.instance().clear()
         try:
@@ -569,8 +535,6 @@ remove_me: should_be_gone
 
     def test_patch_explicit_package_path(self, packaged_config_dir):
         """When _patch_ is in root config, explicit pkg. paths are required."""
-        from lerna import compose, initialize_config_dir
-        from lerna.core.global_hydra import GlobalHydra
 
         GlobalHydra.instance().clear()
         try:
@@ -584,8 +548,6 @@ remove_me: should_be_gone
 
     def test_patch_bare_keys_auto_prefix(self, auto_prefix_config_dir):
         """Bare keys in _patch_ auto-prefix when config itself is packaged."""
-        from lerna import compose, initialize_config_dir
-        from lerna.core.global_hydra import GlobalHydra
 
         GlobalHydra.instance().clear()
         try:
@@ -602,8 +564,6 @@ remove_me: should_be_gone
 
     def test_patch_global_escape(self, global_escape_config_dir):
         """_global_. prefix targets root-level keys regardless of context."""
-        from lerna import compose, initialize_config_dir
-        from lerna.core.global_hydra import GlobalHydra
 
         GlobalHydra.instance().clear()
         try:
@@ -697,8 +657,6 @@ name: app
 
     def test_patch_scoped_package(self, scoped_patch_config_dir):
         """_patch_@pkg scopes bare keys to 'pkg' from root config."""
-        from lerna import compose, initialize_config_dir
-        from lerna.core.global_hydra import GlobalHydra
 
         GlobalHydra.instance().clear()
         try:
@@ -713,8 +671,6 @@ name: app
 
     def test_patch_scoped_multiple_packages(self, scoped_patch_multi_pkg_dir):
         """Multiple _patch_@<pkg> directives can target different packages."""
-        from lerna import compose, initialize_config_dir
-        from lerna.core.global_hydra import GlobalHydra
 
         GlobalHydra.instance().clear()
         try:
@@ -792,9 +748,6 @@ key: value
 
     def test_patch_sweep_override_rejected(self, patch_sweep_config_dir):
         """Sweep overrides in _patch_ should raise ConfigCompositionException."""
-        from lerna import compose, initialize_config_dir
-        from lerna.core.global_hydra import GlobalHydra
-        from lerna.errors import ConfigCompositionException
 
         GlobalHydra.instance().clear()
         try:
@@ -806,9 +759,6 @@ key: value
 
     def test_patch_delete_nonexistent_key(self, patch_nonexistent_delete_dir):
         """Deleting a nonexistent key via _patch_ should raise an error."""
-        from lerna import compose, initialize_config_dir
-        from lerna.core.global_hydra import GlobalHydra
-        from lerna.errors import ConfigCompositionException
 
         GlobalHydra.instance().clear()
         try:
@@ -820,8 +770,6 @@ key: value
 
     def test_patch_empty_package_scope_rejected(self, patch_empty_scope_dir):
         """_patch_@ with empty package should raise ValueError."""
-        from lerna import compose, initialize_config_dir
-        from lerna.core.global_hydra import GlobalHydra
 
         GlobalHydra.instance().clear()
         try:
@@ -937,8 +885,6 @@ root_marker: true
 
     def test_nested_patch_two_levels(self, nested_patch_config_dir):
         """_patch_ in sub-config and root config both apply correctly."""
-        from lerna import compose, initialize_config_dir
-        from lerna.core.global_hydra import GlobalHydra
 
         GlobalHydra.instance().clear()
         try:
@@ -959,8 +905,6 @@ root_marker: true
 
     def test_nested_patch_three_levels(self, nested_patch_deep_dir):
         """Three levels of _patch_ directives accumulate correctly."""
-        from lerna import compose, initialize_config_dir
-        from lerna.core.global_hydra import GlobalHydra
 
         GlobalHydra.instance().clear()
         try:
@@ -1316,6 +1316,17 @@ def test_tag_sweep(value: str, expected: str) -> None:
     assert ret == expected
 
 
+def test_cached_parse_containers_are_isolated() -> None:
+    # identical override strings share a memoized raw parse; the mutable
+    # containers extracted from it must be fresh per Override, so mutating
+    # one result cannot corrupt later parses of the same string
+    sweep = OverridesParser.create().parse_override("key=tag(t1,choice(a,b))")._value
+    assert isinstance(sweep, ChoiceSweep)
+    sweep.tags.add("mutated")
+    again = OverridesParser.create().parse_override("key=tag(t1,choice(a,b))")._value
+    assert again.tags == {"t1"}
+
+
 @mark.parametrize(
     "value, expected",
     [
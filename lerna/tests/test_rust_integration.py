@@ -169,6 +169,16 @@ db:
         result = rs.parse_yaml("items:\n  - a\n  - b\n  - c")
         assert result["items"] == ["a", "b", "c"]
 
+    def test_parse_yaml_batch(self):
+        """Test batch YAML parsing returns (header, config) per document"""
+        import lerna.lerna as rs
+
+        results = rs.parse_yaml_batch(["# @package _global_\nkey: value", "num: 42"])
+        assert results == [
+            ({"package": "_global_"}, {"key": "value"}),
+            ({"package": None}, {"num": 42}),
+        ]
+
 
 class TestRustGlobIntegration:
     """Test Rust glob pattern integration"""
@@ -208,11 +208,92 @@ impl PyConfigLoader {
 /// Parse a YAML string into a Python dict
 #[pyfunction]
 fn parse_yaml(py: Python, content: &str) -> PyResult<Py<PyAny>> {
-    let config =
-        lerna::config::parse_yaml(content).map_err(|e| PyRuntimeError::new_err(e.to_string()))?;
+    // The parse itself touches no Python objects; release the GIL so other
+    // threads can compose concurrently.
+    let config = py
+        .detach(|| lerna::config::parse_yaml(content))
+        .map_err(|e| PyRuntimeError::new_err(e.to_string()))?;
     config_value_to_py(py, &config)
 }
 
+/// Parse a YAML string without raising
+///
+/// Returns (ok, value): the parsed config on success, or the error message on
+/// failure. Callers on fallback paths check the flag instead of paying for a
+/// Python exception raised across the FFI boundary.
+#[pyfunction]
+fn try_parse_yaml(py: Python, content: &str) -> PyResult<(bool, Py<PyAny>)> {
+    match py.detach(|| lerna::config::parse_yaml(content)) {
+        Ok(config) => Ok((true, config_value_to_py(py, &config)?)),
+        Err(e) => Ok((
+            false,
+            e.to_string().into_pyobject(py)?.into_any().unbind(),
+        )),
+    }
+}
+
+/// Parse a YAML byte string without raising; see try_parse_yaml
+#[pyfunction]
+fn try_parse_yaml_bytes(py: Python, content: &[u8]) -> PyResult<(bool, Py<PyAny>)> {
+    match std::str::from_utf8(content) {
+        Ok(content) => try_parse_yaml(py, content),
+        Err(e) => Ok((
+            false,
+            e.to_string().into_pyobject(py)?.into_any().unbind(),
+        )),
+    }
+}
+
+/// Parse a YAML byte string into a Python dict
+///
+/// Accepting bytes lets callers reading binary streams (e.g. zip resources)
+/// skip the Python-side decode; UTF-8 is validated here without a copy.
+#[pyfunction]
+fn parse_yaml_bytes(py: Python, content: &[u8]) -> PyResult<Py<PyAny>> {
+    let content =
+        std::str::from_utf8(content).map_err(|e| PyRuntimeError::new_err(e.to_string()))?;
+    let config = py
+        .detach(|| lerna::config::parse_yaml(content))
+        .map_err(|e| PyRuntimeError::new_err(e.to_string()))?;
+    config_value_to_py(py, &config)
+}
+
+/// Parse multiple YAML documents in a single call
+///
+/// Returns a list of (header, parsed) tuples, one per input, amortizing the
+/// Python<->Rust crossing cost when many small configs are loaded together.
+#[pyfunction]
+fn parse_yaml_batch(py: Python, contents: Vec<String>) -> PyResult<Py<PyAny>> {
+    // Headers and parses are pure Rust; run the whole batch with the GIL
+    // released, then convert the results to Python objects.
+    let parsed: Vec<_> = py.detach(|| {
+        contents
+            .iter()
+            .map(|content| {
+                (
+                    lerna::config::extract_header(content),
+                    lerna::config::parse_yaml(content),
+                )
+            })
+            .collect()
+    });
+
+    let list = PyList::empty(py);
+    for (header, config) in parsed {
+        let py_header = PyDict::new(py);
+        for (key, value) in header {
+            py_header.set_item(key, value)?;
+        }
+        // Add package: None if not present (matching Python behavior)
+        if !py_header.contains("package")? {
+            py_header.set_item("package", py.None())?;
+        }
+        let config = config.map_err(|e| PyRuntimeError::new_err(e.to_string()))?;
+        list.append((py_header, config_value_to_py(py, &config)?))?;
+    }
+    Ok(list.into_any().unbind())
+}
+
 /// Load a YAML file into a Python dict
 #[pyfunction]
 fn load_yaml_file(py: Python, path: &str) -> PyResult<Py<PyAny>> {
@@ -294,6 +375,14 @@ fn extract_header_dict(py: Python, content: &str) -> PyResult<Py<PyAny>> {
     Ok(py_dict.into_any().unbind())
 }
 
+/// Extract header directives from config file content given as bytes
+#[pyfunction]
+fn extract_header_bytes(py: Python, content: &[u8]) -> PyResult<Py<PyAny>> {
+    let content =
+        std::str::from_utf8(content).map_err(|e| PyRuntimeError::new_err(e.to_string()))?;
+    extract_header_dict(py, content)
+}
+
 /// Configuration repository that manages config sources
 ///
 /// This mirrors the Python IConfigRepository interface with optimized Rust implementation.
@@ -507,10 +596,15 @@ pub fn register(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<PyCachingConfigRepository>()?;
     m.add_class::<PyHybridConfigRepository>()?;
     m.add_function(wrap_pyfunction!(parse_yaml, m)?)?;
+    m.add_function(wrap_pyfunction!(parse_yaml_batch, m)?)?;
     m.add_function(wrap_pyfunction!(load_yaml_file, m)?)?;
     m.add_function(wrap_pyfunction!(resolve_interpolations, m)?)?;
     m.add_function(wrap_pyfunction!(compose_config, m)?)?;
+    m.add_function(wrap_pyfunction!(try_parse_yaml, m)?)?;
+    m.add_function(wrap_pyfunction!(try_parse_yaml_bytes, m)?)?;
+    m.add_function(wrap_pyfunction!(parse_yaml_bytes, m)?)?;
     m.add_function(wrap_pyfunction!(extract_header_dict, m)?)?;
+    m.add_function(wrap_pyfunction!(extract_header_bytes, m)?)?;
     Ok(())
 }
 
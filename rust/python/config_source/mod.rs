@@ -325,6 +325,11 @@ impl PyFileConfigSource {
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyIOError, _>(e.to_string()))
     }
 
+    /// Drop cached parse results (intended for tests)
+    fn clear_cache(&self) {
+        self.inner.clear_cache()
+    }
+
     /// Check if path is a group
     fn is_group(&self, config_path: &str) -> bool {
         self.inner.is_group(config_path)
@@ -2,6 +2,7 @@
 //! PyO3 bindings for ConfigStore
 
 use pyo3::exceptions::PyKeyError;
+use pyo3::intern;
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyList};
 
@@ -71,11 +72,67 @@ fn py_to_config_value(py: Python, obj: &Bound<'_, PyAny>) -> PyResult<ConfigValu
         }
         Ok(ConfigValue::Dict(config_dict))
     } else {
+        // OmegaConf nodes nested inside plain containers
+        if let Some(v) = omega_to_config_value(py, obj)? {
+            return Ok(v);
+        }
         // Fallback to string representation
         Ok(ConfigValue::String(obj.str()?.to_string()))
     }
 }
 
+/// Walk an OmegaConf node directly through its instance dict, without the
+/// `OmegaConf.to_container` round-trip on the Python side.
+///
+/// OmegaConf containers keep their children in `__dict__["_content"]` (a dict
+/// or list of nodes) and value nodes keep the raw value in `__dict__["_val"]`.
+/// Reading those slots avoids materializing a full intermediate Python
+/// dict/list tree just for Rust to tear it down again. Returns `None` when
+/// the object is not an OmegaConf node so callers can fall back to the plain
+/// conversion. Matching `to_container(resolve=False)` semantics,
+/// interpolations stay raw strings and non-string dict keys are skipped.
+fn omega_to_config_value(py: Python, obj: &Bound<'_, PyAny>) -> PyResult<Option<ConfigValue>> {
+    let Ok(inst_dict) = obj.getattr(intern!(py, "__dict__")) else {
+        return Ok(None);
+    };
+    let Ok(inst_dict) = inst_dict.cast_into::<PyDict>() else {
+        return Ok(None);
+    };
+    if let Some(val) = inst_dict.get_item(intern!(py, "_val"))? {
+        // ValueNode: _val holds the plain value (or "???" for missing)
+        return Ok(Some(py_to_config_value(py, &val)?));
+    }
+    if let Some(content) = inst_dict.get_item(intern!(py, "_content"))? {
+        if let Ok(dict) = content.cast::<PyDict>() {
+            let mut config_dict = ConfigDict::new();
+            for (key, value) in dict.iter() {
+                if let Ok(k) = key.extract::<String>() {
+                    let v = match omega_to_config_value(py, &value)? {
+                        Some(v) => v,
+                        None => py_to_config_value(py, &value)?,
+                    };
+                    config_dict.insert(k, v);
+                }
+            }
+            return Ok(Some(ConfigValue::Dict(config_dict)));
+        }
+        if let Ok(list) = content.cast::<PyList>() {
+            let mut items = Vec::with_capacity(list.len());
+            for item in list.iter() {
+                let v = match omega_to_config_value(py, &item)? {
+                    Some(v) => v,
+                    None => py_to_config_value(py, &item)?,
+                };
+                items.push(v);
+            }
+            return Ok(Some(ConfigValue::List(items)));
+        }
+        // missing ("???") or None content
+        return Ok(Some(py_to_config_value(py, &content)?));
+    }
+    Ok(None)
+}
+
 /// Python wrapper for a ConfigNode
 #[pyclass(name = "RustConfigNode")]
 #[derive(Clone)]
@@ -159,12 +216,16 @@ impl PyConfigStore {
         package: Option<&str>,
         provider: Option<&str>,
     ) -> PyResult<()> {
-        let config_dict = match py_to_config_value(py, node)? {
+        let value = match omega_to_config_value(py, node)? {
+            Some(v) => v,
+            None => py_to_config_value(py, node)?,
+        };
+        let config_dict = match value {
             ConfigValue::Dict(d) => d,
-            _ => {
+            other => {
                 // If not a dict, wrap it
                 let mut d = ConfigDict::new();
-                d.insert("_value_".to_string(), py_to_config_value(py, node)?);
+                d.insert("_value_".to_string(), other);
                 d
             }
         };
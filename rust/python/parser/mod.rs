@@ -2,6 +2,7 @@
 //! PyO3 bindings for override parser
 
 use pyo3::exceptions::PyValueError;
+use pyo3::intern;
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyList, PySet};
 use std::sync::Arc;
@@ -306,11 +307,13 @@ fn parsed_element_to_py(py: Python<'_>, elem: &RustParsedElement) -> PyResult<Py
             Ok(Py::new(py, py_qs)?.into_any())
         }
         RustParsedElement::List(items) => {
-            let list = PyList::empty(py);
-            for item in items {
-                list.append(parsed_element_to_py(py, item)?)?;
-            }
-            Ok(list.into_pyobject(py)?.to_owned().unbind().into_any())
+            // collect first so the PyList is allocated at its final size
+            // instead of growing append by append
+            let elems: Vec<Py<PyAny>> = items
+                .iter()
+                .map(|item| parsed_element_to_py(py, item))
+                .collect::<PyResult<_>>()?;
+            Ok(PyList::new(py, elems)?.unbind().into_any())
         }
         RustParsedElement::Dict(pairs) => {
             let dict = PyDict::new(py);
@@ -490,7 +493,7 @@ impl From<RustOverride> for PyOverride {
 /// Convert a ChoiceSweep to a Python dictionary
 fn choice_sweep_to_py(py: Python<'_>, cs: &RustChoiceSweep) -> PyResult<Py<PyDict>> {
     let dict = PyDict::new(py);
-    dict.set_item("type", "choice_sweep")?;
+    dict.set_item(intern!(py, "type"), "choice_sweep")?;
     dict.set_item("simple_form", cs.simple_form)?;
     dict.set_item("shuffle", cs.shuffle)?;
 
@@ -501,12 +504,13 @@ fn choice_sweep_to_py(py: Python<'_>, cs: &RustChoiceSweep) -> PyResult<Py<PyDic
     }
     dict.set_item("tags", tags)?;
 
-    // Convert list of elements
-    let list = PyList::empty(py);
-    for elem in &cs.list {
-        list.append(parsed_element_to_py(py, elem)?)?;
-    }
-    dict.set_item("list", list)?;
+    // Convert list of elements; pre-sized so large sweeps allocate once
+    let elems: Vec<Py<PyAny>> = cs
+        .list
+        .iter()
+        .map(|elem| parsed_element_to_py(py, elem))
+        .collect::<PyResult<_>>()?;
+    dict.set_item("list", PyList::new(py, elems)?)?;
 
     Ok(dict.unbind())
 }
@@ -514,7 +518,7 @@ fn choice_sweep_to_py(py: Python<'_>, cs: &RustChoiceSweep) -> PyResult<Py<PyDic
 /// Convert a RangeSweep to a Python dictionary
 fn range_sweep_to_py(py: Python<'_>, rs: &RustRangeSweep) -> PyResult<Py<PyDict>> {
     let dict = PyDict::new(py);
-    dict.set_item("type", "range_sweep")?;
+    dict.set_item(intern!(py, "type"), "range_sweep")?;
     dict.set_item("start", rs.start)?;
     dict.set_item("stop", rs.stop)?;
     dict.set_item("step", rs.step)?;
@@ -534,7 +538,7 @@ fn range_sweep_to_py(py: Python<'_>, rs: &RustRangeSweep) -> PyResult<Py<PyDict>
 /// Convert an IntervalSweep to a Python dictionary
 fn interval_sweep_to_py(py: Python<'_>, is: &RustIntervalSweep) -> PyResult<Py<PyDict>> {
     let dict = PyDict::new(py);
-    dict.set_item("type", "interval_sweep")?;
+    dict.set_item(intern!(py, "type"), "interval_sweep")?;
     dict.set_item("start", is.start)?;
     dict.set_item("end", is.end)?;
     dict.set_item("is_int", is.is_int)?;
@@ -559,29 +563,22 @@ fn override_value_to_py(py: Python<'_>, value: &RustOverrideValue) -> PyResult<P
         RustOverrideValue::GlobChoiceSweep(glob) => {
             // Return glob info as dict
             let dict = PyDict::new(py);
-            dict.set_item("type", "glob_choice_sweep")?;
-            let include = PyList::empty(py);
-            for s in &glob.include {
-                include.append(s)?;
-            }
-            let exclude = PyList::empty(py);
-            for s in &glob.exclude {
-                exclude.append(s)?;
-            }
-            dict.set_item("include", include)?;
-            dict.set_item("exclude", exclude)?;
+            dict.set_item(intern!(py, "type"), "glob_choice_sweep")?;
+            dict.set_item("include", PyList::new(py, &glob.include)?)?;
+            dict.set_item("exclude", PyList::new(py, &glob.exclude)?)?;
             Ok(dict.unbind().into_any())
         }
         RustOverrideValue::ListExtension(ext) => {
             // Return list extension info as dict with operation, values, and index
             let dict = PyDict::new(py);
-            dict.set_item("type", "list_extension")?;
+            dict.set_item(intern!(py, "type"), "list_extension")?;
             dict.set_item("operation", ext.operation.to_string())?;
-            let values = PyList::empty(py);
-            for elem in &ext.values {
-                values.append(parsed_element_to_py(py, elem)?)?;
-            }
-            dict.set_item("values", values)?;
+            let elems: Vec<Py<PyAny>> = ext
+                .values
+                .iter()
+                .map(|elem| parsed_element_to_py(py, elem))
+                .collect::<PyResult<_>>()?;
+            dict.set_item("values", PyList::new(py, elems)?)?;
             if let Some(idx) = ext.index {
                 dict.set_item("index", idx)?;
             } else {
@@ -624,51 +621,55 @@ impl PyOverrideParser {
     /// Parse and return full data as a dictionary for Python to use
     fn parse_to_dict(&self, py: Python<'_>, s: &str) -> PyResult<Py<PyDict>> {
         let result = if let Some(ref callback) = self.callback {
+            // user functions call back into Python mid-parse; stay attached
             RustOverrideParser::parse_with_callback(s, callback.clone())
         } else {
-            RustOverrideParser::parse(s)
+            // pure Rust parse; let other Python threads run meanwhile
+            py.detach(|| RustOverrideParser::parse(s))
         }
         .map_err(|e| PyValueError::new_err(format!("{}", e)))?;
 
         let dict = PyDict::new(py);
 
-        // Override type
-        let type_str = match result.override_type {
-            lerna::OverrideType::Change => "CHANGE",
-            lerna::OverrideType::Add => "ADD",
-            lerna::OverrideType::ForceAdd => "FORCE_ADD",
-            lerna::OverrideType::Del => "DEL",
-            lerna::OverrideType::ExtendList => "EXTEND_LIST",
+        // Override type, as an index into Python's _OVERRIDE_TYPES tuple;
+        // tuple indexing on the Python side is cheaper than a string-keyed
+        // dict lookup per override
+        let type_idx: u8 = match result.override_type {
+            lerna::OverrideType::Change => 0,
+            lerna::OverrideType::Add => 1,
+            lerna::OverrideType::ForceAdd => 2,
+            lerna::OverrideType::Del => 3,
+            lerna::OverrideType::ExtendList => 4,
         };
-        dict.set_item("type", type_str)?;
+        dict.set_item(intern!(py, "type"), type_idx)?;
 
         // Key
-        dict.set_item("key_or_group", &result.key.key_or_group)?;
-        dict.set_item("package", result.key.package.as_deref())?;
+        dict.set_item(intern!(py, "key_or_group"), &result.key.key_or_group)?;
+        dict.set_item(intern!(py, "package"), result.key.package.as_deref())?;
 
-        // Value type
-        let value_type = match &result.value {
+        // Value type, as an index into Python's _VALUE_TYPES tuple
+        let value_type_idx: u8 = match &result.value {
             Some(v) => match v.value_type() {
-                RustValueType::Element => "ELEMENT",
-                RustValueType::ChoiceSweep => "CHOICE_SWEEP",
-                RustValueType::GlobChoiceSweep => "GLOB_CHOICE_SWEEP",
-                RustValueType::SimpleChoiceSweep => "SIMPLE_CHOICE_SWEEP",
-                RustValueType::RangeSweep => "RANGE_SWEEP",
-                RustValueType::IntervalSweep => "INTERVAL_SWEEP",
-                RustValueType::ListExtension => "LIST_EXTENSION",
+                RustValueType::Element => 0,
+                RustValueType::ChoiceSweep => 1,
+                RustValueType::SimpleChoiceSweep => 2,
+                RustValueType::GlobChoiceSweep => 3,
+                RustValueType::RangeSweep => 4,
+                RustValueType::IntervalSweep => 5,
+                RustValueType::ListExtension => 6,
             },
-            None => "ELEMENT",
+            None => 0,
         };
-        dict.set_item("value_type", value_type)?;
+        dict.set_item(intern!(py, "value_type"), value_type_idx)?;
 
         // Value
         if let Some(ref value) = result.value {
-            dict.set_item("value", override_value_to_py(py, value)?)?;
+            dict.set_item(intern!(py, "value"), override_value_to_py(py, value)?)?;
         } else {
-            dict.set_item("value", py.None())?;
+            dict.set_item(intern!(py, "value"), py.None())?;
         }
 
-        dict.set_item("input_line", s)?;
+        dict.set_item(intern!(py, "input_line"), s)?;
 
         Ok(dict.unbind())
     }
@@ -677,9 +678,11 @@ impl PyOverrideParser {
     fn parse_many(&self, py: Python<'_>, overrides: Vec<String>) -> PyResult<Py<PyList>> {
         let str_refs: Vec<&str> = overrides.iter().map(|s| s.as_str()).collect();
         let results = if let Some(ref callback) = self.callback {
+            // user functions call back into Python mid-parse; stay attached
             RustOverrideParser::parse_many_with_callback(&str_refs, callback.clone())
         } else {
-            RustOverrideParser::parse_many(&str_refs)
+            // pure Rust parse; let other Python threads run meanwhile
+            py.detach(|| RustOverrideParser::parse_many(&str_refs))
         }
         .map_err(|e| PyValueError::new_err(format!("{}", e)))?;
 
@@ -1,6 +1,7 @@
 // Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 //! YAML configuration parser
 
+use std::borrow::Cow;
 use std::fs;
 use std::path::Path;
 
@@ -43,7 +44,14 @@ impl std::error::Error for ConfigLoadError {}
 
 /// Parse a YAML string into a ConfigValue
 pub fn parse_yaml(content: &str) -> Result<ConfigValue, ConfigLoadError> {
-    let normalized = normalize_legacy_bool_scalars(content);
+    // The legacy-bool rewrite copies the whole document; most files contain
+    // no True/False token at all, so a cheap substring scan lets them go to
+    // the parser unmodified.
+    let normalized: Cow<'_, str> = if content.contains("True") || content.contains("False") {
+        Cow::Owned(normalize_legacy_bool_scalars(content))
+    } else {
+        Cow::Borrowed(content)
+    };
 
     // Use serde_yaml for parsing
     let yaml: serde_yaml::Value = serde_yaml::from_str(&normalized)
@@ -55,19 +63,16 @@ pub fn parse_yaml(content: &str) -> Result<ConfigValue, ConfigLoadError> {
 fn normalize_legacy_bool_scalars(content: &str) -> String {
     let mut normalized = String::with_capacity(content.len());
 
+    // split_inclusive() already includes the final line when there is no
+    // trailing newline
     for line in content.split_inclusive('\n') {
-        normalized.push_str(&normalize_legacy_bool_line(line));
-    }
-
-    if !content.ends_with('\n') && !content.is_empty() {
-        // split_inclusive() already includes the final line when no trailing newline,
-        // so this branch intentionally does nothing.
+        append_normalized_legacy_bool_line(&mut normalized, line);
     }
 
     normalized
 }
 
-fn normalize_legacy_bool_line(line: &str) -> String {
+fn append_normalized_legacy_bool_line(out: &mut String, line: &str) {
     let (body, newline) = if let Some(stripped) = line.strip_suffix('\n') {
         (stripped, "\n")
     } else {
@@ -79,20 +84,14 @@ fn normalize_legacy_bool_line(line: &str) -> String {
     let comment = &body[comment_start..];
 
     if let Some((start, end, replacement)) = find_legacy_bool_span(code) {
-        let mut out = String::with_capacity(line.len());
         out.push_str(&code[..start]);
         out.push_str(replacement);
         out.push_str(&code[end..]);
-        out.push_str(comment);
-        out.push_str(newline);
-        return out;
+    } else {
+        out.push_str(code);
     }
-
-    let mut out = String::with_capacity(line.len());
-    out.push_str(code);
     out.push_str(comment);
     out.push_str(newline);
-    out
 }
 
 fn find_comment_start(line: &str) -> Option<usize> {
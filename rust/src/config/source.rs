@@ -4,8 +4,10 @@
 use std::collections::HashMap;
 use std::fs;
 use std::path::PathBuf;
+use std::sync::{Arc, RwLock};
+use std::time::SystemTime;
 
-use crate::config::parser::{extract_header, load_yaml_file, ConfigLoadError};
+use crate::config::parser::{extract_header, parse_yaml, ConfigLoadError};
 use crate::config::value::ConfigValue;
 use crate::ObjectType;
 
@@ -56,10 +58,22 @@ pub trait ConfigSource: Send + Sync {
     fn list(&self, config_path: &str, results_filter: Option<ObjectType>) -> Vec<String>;
 }
 
+/// A parsed YAML file kept for reuse, valid as long as the file's mtime
+/// doesn't change.
+struct CachedParse {
+    mtime: SystemTime,
+    config: ConfigValue,
+    header: HashMap<String, String>,
+}
+
 /// File-based configuration source
 pub struct FileConfigSource {
     provider_name: String,
     base_path: PathBuf,
+    // The same config file is loaded repeatedly across defaults resolution
+    // and multirun jobs; YAML parsing dominates the load cost, so parsed
+    // results are kept per path and revalidated against the file's mtime.
+    parse_cache: RwLock<HashMap<PathBuf, Arc<CachedParse>>>,
 }
 
 impl FileConfigSource {
@@ -74,6 +88,22 @@ impl FileConfigSource {
         Self {
             provider_name: provider.to_string(),
             base_path: PathBuf::from(clean_path),
+            parse_cache: RwLock::new(HashMap::new()),
+        }
+    }
+
+    /// Drop all cached parse results (intended for tests).
+    pub fn clear_cache(&self) {
+        self.parse_cache.write().unwrap().clear();
+    }
+
+    fn make_result(&self, config: ConfigValue, header: HashMap<String, String>) -> ConfigResult {
+        ConfigResult {
+            provider: self.provider_name.clone(),
+            path: format!("{}://{}", self.scheme(), self.base_path.display()),
+            config,
+            header,
+            is_schema_source: false,
         }
     }
 
@@ -113,7 +143,16 @@ impl ConfigSource for FileConfigSource {
     fn load_config(&self, config_path: &str) -> Result<ConfigResult, ConfigLoadError> {
         let full_path = self.normalize_config_path(config_path);
 
-        // Read header first
+        let mtime = fs::metadata(&full_path).and_then(|m| m.modified()).ok();
+
+        if let Some(mtime) = mtime {
+            if let Some(cached) = self.parse_cache.read().unwrap().get(&full_path) {
+                if cached.mtime == mtime {
+                    return Ok(self.make_result(cached.config.clone(), cached.header.clone()));
+                }
+            }
+        }
+
         let content = fs::read_to_string(&full_path).map_err(|e| {
             ConfigLoadError::with_path(
                 format!("Failed to read: {}", e),
@@ -122,15 +161,23 @@ impl ConfigSource for FileConfigSource {
         })?;
 
         let header = extract_header(&content);
-        let config = load_yaml_file(&full_path)?;
+        let config = parse_yaml(&content).map_err(|mut e| {
+            e.path = Some(full_path.to_string_lossy().to_string());
+            e
+        })?;
 
-        Ok(ConfigResult {
-            provider: self.provider_name.clone(),
-            path: format!("{}://{}", self.scheme(), self.base_path.display()),
-            config,
-            header,
-            is_schema_source: false,
-        })
+        if let Some(mtime) = mtime {
+            self.parse_cache.write().unwrap().insert(
+                full_path,
+                Arc::new(CachedParse {
+                    mtime,
+                    config: config.clone(),
+                    header: header.clone(),
+                }),
+            );
+        }
+
+        Ok(self.make_result(config, header))
     }
 
     fn is_group(&self, config_path: &str) -> bool {
@@ -156,14 +203,21 @@ impl ConfigSource for FileConfigSource {
                     continue;
                 }
 
-                let _file_path = if config_path.is_empty() {
-                    file_name.clone()
+                // DirEntry::file_type comes from the directory read itself on
+                // most platforms; Path::is_dir/is_file would each stat again.
+                // Symlinks still need the extra stat to classify the target.
+                let Ok(file_type) = entry.file_type() else {
+                    continue;
+                };
+                let (is_dir, is_file) = if file_type.is_symlink() {
+                    let path = entry.path();
+                    (path.is_dir(), path.is_file())
                 } else {
-                    format!("{}/{}", config_path, file_name)
+                    (file_type.is_dir(), file_type.is_file())
                 };
-                let is_group = entry.path().is_dir();
-                let is_config = entry.path().is_file()
-                    && (file_name.ends_with(".yaml") || file_name.ends_with(".yml"));
+                let is_group = is_dir;
+                let is_config =
+                    is_file && (file_name.ends_with(".yaml") || file_name.ends_with(".yml"));
 
                 let include = match results_filter {
                     None => is_group || is_config,
@@ -1391,9 +1391,11 @@ impl OverrideParser {
         }
 
         // Handle different functions
-        // First, check if user has defined a function with this name (allows shadowing built-ins)
-        if let Some(callback) = &self.function_callback {
-            if callback.has_function(name) {
+        // User-defined functions shadow built-ins; has_function was already
+        // queried above, and each query is a round trip into Python, so the
+        // answer is reused here instead of asking again.
+        if use_user_function {
+            if let Some(callback) = &self.function_callback {
                 match callback.call(name, args, kwargs) {
                     Ok(result) => return Ok(OverrideValue::Element(result)),
                     Err(e) => {